@@ -8,30 +8,25 @@ Usage:
 
 import argparse
 from pathlib import Path
-import yaml
 
 import pandas as pd
 
+from src.config import load_config
 from src.layoffs_data import fetch_layoffs_data, clean_layoffs_data, get_layoffs_last_n_months
-from src.sentiment import add_sentiment_to_df
+from src.sentiment import ensure_sentiment, SENTIMENT_CACHE_PATH
 from src.combined_analysis import (
+    find_latest_reddit_path,
+    load_cached_combined,
+    save_cached_combined,
     load_reddit_data,
+    filter_companies_with_both,
     analyze_company_sentiment,
     combine_layoffs_and_sentiment,
-    plot_layoffs_vs_mentions,
-    plot_sentiment_by_layoff_size,
-    plot_correlation_analysis,
-    create_combined_dashboard,
+    render_all,
     print_combined_summary,
 )
 
 
-def load_config() -> dict:
-    config_path = Path("config/settings.yaml")
-    with open(config_path, "r") as f:
-        return yaml.safe_load(f)
-
-
 def main():
     parser = argparse.ArgumentParser(description="Combined layoffs and sentiment analysis")
     parser.add_argument("--save", action="store_true", help="Save charts to data/")
@@ -48,9 +43,10 @@ def main():
     reddit_df = load_reddit_data()
     print(f"  Loaded {len(reddit_df)} Reddit posts")
 
-    # Add sentiment
+    # Score sentiment once up front (cached by post id; only new
+    # posts are scored) - downstream stages assume the columns exist
     print("Analyzing sentiment...")
-    reddit_df = add_sentiment_to_df(reddit_df)
+    reddit_df = ensure_sentiment(reddit_df)
 
     # Load layoffs data
     print("\nLoading layoffs data...")
@@ -60,34 +56,45 @@ def main():
     print(f"  Loaded {len(layoffs_df)} layoff events")
     print(f"  Total laid off: {layoffs_df['laid_off_count'].sum():,}")
 
-    # Analyze company sentiment in Reddit data
-    print("\nAnalyzing company mentions and sentiment...")
-    company_sentiment = analyze_company_sentiment(reddit_df, companies)
-    print(f"  Found {len(company_sentiment)} companies mentioned in Reddit")
-
-    # Combine datasets
-    print("\nCombining datasets...")
-    combined_df = combine_layoffs_and_sentiment(layoffs_df, company_sentiment)
+    # Combine datasets, reusing the cached per-company frame when the
+    # Reddit data and the layoff fixture are unchanged since last run
+    reddit_path = find_latest_reddit_path()
+    # Everything the combined frame is derived from: the Reddit data,
+    # the layoff fixture, the company list in the config, and the
+    # sentiment scores feeding the per-company aggregates
+    cache_inputs = [
+        reddit_path,
+        Path("src/layoffs_data.py"),
+        Path("config/settings.yaml"),
+        SENTIMENT_CACHE_PATH,
+    ]
+    combined_df = load_cached_combined(cache_inputs)
+
+    if combined_df is not None:
+        print("\nUsing cached combined analysis (inputs unchanged)")
+    else:
+        print("\nAnalyzing company mentions and sentiment...")
+        company_sentiment = analyze_company_sentiment(reddit_df, companies, data_path=reddit_path)
+        print(f"  Found {len(company_sentiment)} companies mentioned in Reddit")
+
+        print("\nCombining datasets...")
+        combined_df = combine_layoffs_and_sentiment(layoffs_df, company_sentiment)
+        save_cached_combined(combined_df)
+
+    # Companies with both layoffs and mentions; the summary and every
+    # chart read this same subset, so scan the frame for it only once
+    filtered_df = filter_companies_with_both(combined_df)
 
     # Print summary
-    print_combined_summary(combined_df)
+    print_combined_summary(combined_df, filtered_df=filtered_df)
 
     # Generate visualizations
     print("\n" + "=" * 80)
     print("GENERATING VISUALIZATIONS")
     print("=" * 80)
 
-    print("\n[1/4] Layoffs vs Mentions scatter plot...")
-    plot_layoffs_vs_mentions(combined_df, output_dir)
-
-    print("\n[2/4] Sentiment by layoff size...")
-    plot_sentiment_by_layoff_size(combined_df, output_dir)
-
-    print("\n[3/4] Correlation analysis...")
-    plot_correlation_analysis(combined_df, output_dir)
-
-    print("\n[4/4] Combined dashboard...")
-    create_combined_dashboard(combined_df, reddit_df, layoffs_df, output_dir)
+    print("\nRendering 4 charts in parallel...")
+    render_all(combined_df, reddit_df, layoffs_df, output_dir, filtered_df=filtered_df)
 
     # Save combined data
     if args.save:
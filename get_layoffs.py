@@ -24,7 +24,7 @@ def main():
     parser = argparse.ArgumentParser(description="Fetch actual layoff data")
     parser.add_argument("--months", type=int, default=6, help="Number of months to include")
     parser.add_argument("--top", type=int, default=20, help="Top N companies to show")
-    parser.add_argument("--save", action="store_true", help="Save to CSV")
+    parser.add_argument("--save", action="store_true", help="Save raw data to Parquet and the monthly pivot to CSV")
     args = parser.parse_args()
 
     # Fetch data
@@ -59,9 +59,9 @@ def main():
     if args.save:
         Path("data").mkdir(exist_ok=True)
 
-        # Save raw filtered data
-        raw_path = Path("data/layoffs_actual.csv")
-        df_filtered.to_csv(raw_path, index=False)
+        # Save raw filtered data (Parquet keeps dtypes, no date re-parsing on load)
+        raw_path = Path("data/layoffs_actual.parquet")
+        df_filtered.to_parquet(raw_path, engine="pyarrow", compression="zstd")
         print(f"\nSaved raw data to: {raw_path}")
 
         # Save pivot table
@@ -7,9 +7,9 @@ Usage:
 """
 
 import argparse
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 
-import yaml
 from tqdm import tqdm
 
 from src.scraper import (
@@ -19,18 +19,19 @@ from src.scraper import (
     scrape_subreddit_praw,
     scrape_comments_public,
 )
-from src.storage import save_posts_csv, save_posts_json, get_output_path
+from src.storage import (
+    ParquetBatchWriter,
+    save_posts_csv,
+    save_posts_json,
+    save_posts_parquet,
+    load_posts,
+    get_output_path,
+)
 from src.analyzer import analyze_posts, print_analysis
+from src.config import load_config
 import pandas as pd
 
 
-def load_config() -> dict:
-    """Load configuration from YAML file."""
-    config_path = Path("config/settings.yaml")
-    with open(config_path, "r") as f:
-        return yaml.safe_load(f)
-
-
 def scrape_all(config: dict) -> pd.DataFrame:
     """Scrape all configured subreddits."""
     all_posts = []
@@ -47,9 +48,7 @@ def scrape_all(config: dict) -> pd.DataFrame:
         print("No API credentials found - using public JSON API")
         reddit = None
 
-    for subreddit in subreddits:
-        print(f"\nScraping r/{subreddit}...")
-
+    def fetch_posts(subreddit: str) -> list[dict]:
         if use_praw:
             post_gen = scrape_subreddit_praw(
                 reddit,
@@ -65,31 +64,53 @@ def scrape_all(config: dict) -> pd.DataFrame:
                 sort_by=scrape_cfg["sort_by"],
                 time_filter=scrape_cfg["time_filter"],
             )
+        return list(post_gen)
+
+    # Fetch subreddits concurrently; the scraper's shared rate limiter
+    # keeps the aggregate request rate within Reddit's limits.
+    print(f"\nScraping {len(subreddits)} subreddits in parallel...")
+    with ThreadPoolExecutor(max_workers=min(8, len(subreddits))) as executor:
+        futures = {executor.submit(fetch_posts, sub): sub for sub in subreddits}
+        results = {}
+        for future in tqdm(as_completed(futures), total=len(futures), desc="Subreddits"):
+            results[futures[future]] = future.result()
+
+    # Stream posts straight into a single Parquet file, one batch per
+    # subreddit, instead of accumulating everything in a Python list.
+    storage_cfg = config["storage"]
+    writer = None
+    if storage_cfg["format"] == "parquet":
+        posts_path = get_output_path(storage_cfg["data_dir"], "all", "posts", "parquet")
+        writer = ParquetBatchWriter(posts_path)
 
-        posts = list(
-            tqdm(
-                post_gen,
-                desc=f"r/{subreddit}",
-                total=scrape_cfg["posts_per_subreddit"],
-            )
-        )
+    for subreddit in subreddits:
+        posts = results[subreddit]
+        print(f"  r/{subreddit}: fetched {len(posts)} posts")
 
-        all_posts.extend(posts)
-        print(f"  Fetched {len(posts)} posts")
+        if writer is not None:
+            writer.write_batch(posts)
+        else:
+            all_posts.extend(posts)
 
         # Optionally scrape comments (public API only for now)
         if scrape_cfg.get("include_comments") and not use_praw:
             print(f"  Scraping comments...")
             all_comments = []
-            for post in tqdm(posts[:30], desc="Comments"):  # Limit to top 30 posts
-                comments = list(
+
+            def fetch_comments(post) -> list[dict]:
+                return list(
                     scrape_comments_public(
-                        post["id"],
+                        post.id,
                         subreddit,
                         limit=scrape_cfg["comments_per_post"],
                     )
                 )
-                all_comments.extend(comments)
+
+            # Fan out concurrently; the shared rate limiter spaces requests
+            with ThreadPoolExecutor(max_workers=5) as comment_pool:
+                futures = [comment_pool.submit(fetch_comments, post) for post in posts[:30]]  # Limit to top 30 posts
+                for future in tqdm(as_completed(futures), total=len(futures), desc="Comments"):
+                    all_comments.extend(future.result())
 
             if all_comments:
                 storage_cfg = config["storage"]
@@ -97,11 +118,20 @@ def scrape_all(config: dict) -> pd.DataFrame:
                 comments_path = get_output_path(
                     storage_cfg["data_dir"], subreddit, "comments", ext
                 )
-                if ext == "csv":
+                if ext == "parquet":
+                    save_posts_parquet(all_comments, comments_path)
+                elif ext == "csv":
                     save_posts_csv(all_comments, comments_path)
                 else:
                     save_posts_json(all_comments, comments_path)
 
+    if writer is not None:
+        writer.close()
+        # Nothing fetched means no batches and no file on disk; hand
+        # back an empty frame so main()'s df.empty check handles it
+        if writer.rows_written == 0:
+            return pd.DataFrame()
+        return load_posts(writer.filepath)
     return pd.DataFrame(all_posts)
 
 
@@ -110,7 +140,7 @@ def main():
     parser.add_argument(
         "--analyze",
         type=str,
-        help="Path to existing CSV to analyze (skip scraping)",
+        help="Path to existing data file (Parquet or CSV) to analyze (skip scraping)",
     )
     args = parser.parse_args()
 
@@ -118,7 +148,7 @@ def main():
 
     if args.analyze:
         print(f"Loading data from {args.analyze}...")
-        df = pd.read_csv(args.analyze, parse_dates=["created_utc"])
+        df = load_posts(Path(args.analyze))
     else:
         df = scrape_all(config)
 
@@ -126,15 +156,16 @@ def main():
             print("No posts fetched!")
             return
 
-        # Save posts
+        # Save posts (parquet is streamed to disk during scraping)
         storage_cfg = config["storage"]
         ext = storage_cfg["format"]
-        posts_path = get_output_path(storage_cfg["data_dir"], "all", "posts", ext)
+        if ext != "parquet":
+            posts_path = get_output_path(storage_cfg["data_dir"], "all", "posts", ext)
 
-        if ext == "csv":
-            save_posts_csv(df.to_dict("records"), posts_path)
-        else:
-            save_posts_json(df.to_dict("records"), posts_path)
+            if ext == "csv":
+                save_posts_csv(df.to_dict("records"), posts_path)
+            else:
+                save_posts_json(df.to_dict("records"), posts_path)
 
     # Analyze
     stats = analyze_posts(df, config)
@@ -4,24 +4,31 @@ import re
 from collections import Counter
 from datetime import datetime
 
+import numpy as np
 import pandas as pd
 
 
-def extract_companies(text: str, company_list: list[str]) -> list[str]:
-    """Extract mentioned companies from text."""
-    if not text:
-        return []
+def build_company_pattern(company_list: list[str]) -> re.Pattern:
+    """Compile a single alternation pattern matching any company name.
+
+    One compiled scan replaces N independent per-company searches.
+    Alternatives are ordered longest-first so multi-word names like
+    "x corp" win over any shorter name they contain.
+    """
+    # Word boundary match to avoid partial matches
+    names = sorted(company_list, key=len, reverse=True)
+    return re.compile(
+        r'\b(' + '|'.join(re.escape(c.lower()) for c in names) + r')\b',
+        re.IGNORECASE,
+    )
 
-    text_lower = text.lower()
-    found = []
 
-    for company in company_list:
-        # Word boundary match to avoid partial matches
-        pattern = r'\b' + re.escape(company.lower()) + r'\b'
-        if re.search(pattern, text_lower):
-            found.append(company)
+def extract_companies(text: str, pattern: re.Pattern) -> set[str]:
+    """Extract mentioned companies from text using a precompiled pattern."""
+    if not text:
+        return set()
 
-    return found
+    return {match.lower() for match in pattern.findall(text)}
 
 
 def analyze_posts(df: pd.DataFrame, config: dict) -> dict:
@@ -32,6 +39,11 @@ def analyze_posts(df: pd.DataFrame, config: dict) -> dict:
     """
     companies = config.get("keywords", {}).get("companies", [])
 
+    # One extraction of the numeric buffers feeds the means here and
+    # the top-K selection below - no repeated Series dispatch
+    scores = df["score"].to_numpy()
+    comments = df["num_comments"].to_numpy()
+
     # Basic stats
     stats = {
         "total_posts": len(df),
@@ -39,27 +51,38 @@ def analyze_posts(df: pd.DataFrame, config: dict) -> dict:
             "start": df["created_utc"].min(),
             "end": df["created_utc"].max(),
         },
-        "avg_score": df["score"].mean(),
-        "avg_comments": df["num_comments"].mean(),
+        "avg_score": scores.mean() if len(scores) else float("nan"),
+        "avg_comments": comments.mean() if len(comments) else float("nan"),
         "subreddit_breakdown": df["subreddit"].value_counts().to_dict(),
     }
 
-    # Company mentions
-    company_mentions = Counter()
-    for _, row in df.iterrows():
-        text = f"{row['title']} {row.get('selftext', '')}"
-        found = extract_companies(text, companies)
-        company_mentions.update(found)
+    # Company mentions - vectorized scan over title + selftext
+    pattern = build_company_pattern(companies)
+    if "selftext" in df.columns:
+        text_combined = df["title"].fillna("") + " " + df["selftext"].fillna("")
+    else:
+        text_combined = df["title"].fillna("")
+    mentions = text_combined.str.lower().str.findall(pattern).explode().dropna()
+    # Count each company at most once per post, as extract_companies did
+    mentions = mentions.to_frame("company").reset_index().drop_duplicates()
+    company_mentions = Counter(mentions["company"].value_counts().to_dict())
 
     stats["company_mentions"] = dict(company_mentions.most_common(20))
 
-    # Posts by day
-    df["date"] = pd.to_datetime(df["created_utc"]).dt.date
-    stats["posts_by_day"] = df.groupby("date").size().to_dict()
-
-    # Top posts by engagement
-    top_posts = df.nlargest(10, "score")[["title", "score", "num_comments", "subreddit"]]
-    stats["top_posts"] = top_posts.to_dict("records")
+    # Posts by day - floor to datetime64 keys (int64 hash, not PyObject)
+    days = pd.to_datetime(df["created_utc"]).dt.floor("D")
+    stats["posts_by_day"] = df.groupby(days).size().to_dict()
+
+    # Top posts by engagement - partial sort of the score buffer for
+    # the K row positions instead of nlargest sorting a frame copy
+    k = min(10, len(scores))
+    if k:
+        idx = np.argpartition(-scores, k - 1)[:k]
+        idx = idx[np.argsort(-scores[idx], kind="stable")]
+        top_posts = df.iloc[idx][["title", "score", "num_comments", "subreddit"]]
+        stats["top_posts"] = top_posts.to_dict("records")
+    else:
+        stats["top_posts"] = []
 
     return stats
 
@@ -1,5 +1,7 @@
 """Combined analysis of actual layoffs and Reddit sentiment."""
 
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
 from pathlib import Path
 import pandas as pd
 import matplotlib
@@ -7,91 +9,242 @@ matplotlib.use('Agg')
 import matplotlib.pyplot as plt
 import seaborn as sns
 import numpy as np
-import re
+from matplotlib.ticker import FuncFormatter
 
-from src.sentiment import add_sentiment_to_df
-from src.analyzer import extract_companies
+from src.analyzer import build_company_pattern
+from src.storage import load_posts
 
+# Skip the tight-bbox second render pass on save; simplify/chunk paths
+# so the Agg rasterizer handles dense scatters cheaply
+plt.rcParams["savefig.bbox"] = "standard"
+plt.rcParams["path.simplify_threshold"] = 1.0
+plt.rcParams["agg.path.chunksize"] = 10000
 
-def load_reddit_data(data_dir: Path = Path("data")) -> pd.DataFrame:
-    """Load the most recent Reddit posts data."""
+# One shared axis formatter for all charts instead of a fresh
+# FuncFormatter + lambda per call site
+_KFMT = FuncFormatter(lambda x, _: f"{x/1000:.0f}k")
+
+
+COMBINED_CACHE_PATH = Path("data/combined_analysis_cache.parquet")
+
+
+# Columns the combined pipeline actually reads; everything else is skipped
+REDDIT_COLUMNS = ["id", "subreddit", "title", "selftext", "created_utc", "score", "num_comments"]
+
+
+def find_latest_reddit_path(data_dir: Path = Path("data")) -> Path:
+    """Locate the most recent Reddit posts file (Parquet preferred, CSV fallback)."""
     import glob
-    files = glob.glob(str(data_dir / "all_posts_*.csv"))
+    import os
+    files = glob.glob(str(data_dir / "all_posts_*.parquet")) or glob.glob(str(data_dir / "all_posts_*.csv"))
     if not files:
         raise FileNotFoundError("No Reddit data found. Run main.py first.")
-    latest = sorted(files)[-1]
-    df = pd.read_csv(latest, parse_dates=["created_utc"])
-    return df
+    return Path(max(files, key=os.path.getmtime))
+
+
+def load_reddit_data(data_dir: Path = Path("data")) -> pd.DataFrame:
+    """Load the most recent Reddit posts data, projecting only used columns."""
+    return load_posts(find_latest_reddit_path(data_dir), columns=REDDIT_COLUMNS)
+
+
+def load_cached_combined(inputs: list[Path], cache_path: Path = COMBINED_CACHE_PATH):
+    """Return the cached combined frame, or None if any input is newer."""
+    if not cache_path.exists():
+        return None
+    cache_mtime = cache_path.stat().st_mtime
+    if any(p.exists() and p.stat().st_mtime > cache_mtime for p in inputs):
+        return None
+    return pd.read_parquet(cache_path)
+
+
+def save_cached_combined(combined_df: pd.DataFrame, cache_path: Path = COMBINED_CACHE_PATH) -> None:
+    """Persist the combined frame for reuse while inputs are unchanged."""
+    cache_path.parent.mkdir(parents=True, exist_ok=True)
+    combined_df.to_parquet(cache_path, engine="pyarrow", compression="zstd")
 
 
 def load_layoffs_data(data_dir: Path = Path("data")) -> pd.DataFrame:
     """Load actual layoffs data."""
+    parquet_path = data_dir / "layoffs_actual.parquet"
+    if parquet_path.exists():
+        return pd.read_parquet(parquet_path)
     filepath = data_dir / "layoffs_actual.csv"
     if not filepath.exists():
         raise FileNotFoundError("No layoffs data found. Run get_layoffs.py --save first.")
     return pd.read_csv(filepath, parse_dates=["date"])
 
 
-def analyze_company_sentiment(reddit_df: pd.DataFrame, companies: list) -> pd.DataFrame:
-    """Analyze sentiment for posts mentioning specific companies."""
-    if "sentiment_label" not in reddit_df.columns:
-        reddit_df = add_sentiment_to_df(reddit_df)
+def _extract_company_hits(reddit_df: pd.DataFrame, companies: list) -> pd.DataFrame:
+    """One (row, company) frame of company mentions across all posts.
 
-    reddit_df["text_combined"] = reddit_df["title"].fillna("") + " " + reddit_df["selftext"].fillna("")
+    A single compiled alternation tags every pair in one extractall pass,
+    replacing one full-column contains scan per company.
+    """
+    # Materialize the lowercased text once; callers that already carry
+    # the column (e.g. repeat calls on the same frame) skip the rebuild
+    if "text_combined_lower" not in reddit_df.columns:
+        reddit_df["text_combined_lower"] = (
+            reddit_df["title"].fillna("") + " " + reddit_df["selftext"].fillna("")
+        ).str.lower()
+
+    pattern = build_company_pattern(companies)
+    hits = (
+        reddit_df["text_combined_lower"]
+        .str.extractall(pattern)
+        .droplevel("match")
+        .rename(columns={0: "company"})
+    )
+    return hits.reset_index().drop_duplicates().set_index("index")
+
+
+def build_company_index(reddit_df: pd.DataFrame, companies: list) -> dict:
+    """Build an inverted index {company -> int32 row positions}."""
+    hits = _extract_company_hits(reddit_df, companies)
+    return {
+        company: grp.index.to_numpy().astype(np.int32)
+        for company, grp in hits.groupby("company")
+    }
+
+
+def _company_index_path(data_path: Path, companies: list, cache_dir: Path) -> Path:
+    """Cache file keyed on the data file's identity and the company list."""
+    import hashlib
+    stat = Path(data_path).stat()
+    key = hashlib.sha1(
+        f"{Path(data_path).name}:{stat.st_mtime_ns}:{stat.st_size}:"
+        f"{'|'.join(sorted(companies))}".encode()
+    ).hexdigest()[:16]
+    return cache_dir / f"company_index_{key}.npz"
+
+
+def load_company_index(data_path: Path, companies: list,
+                       cache_dir: Path = Path("data")) -> dict | None:
+    """Load the persisted inverted index, or None on a cache miss."""
+    path = _company_index_path(data_path, companies, cache_dir)
+    if not path.exists():
+        return None
+    with np.load(path) as npz:
+        return {name: npz[name] for name in npz.files}
+
+
+def save_company_index(index: dict, data_path: Path, companies: list,
+                       cache_dir: Path = Path("data")) -> None:
+    """Persist the inverted index alongside the data it was built from."""
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    np.savez_compressed(_company_index_path(data_path, companies, cache_dir), **index)
+
+
+def _hits_from_index(index: dict) -> pd.DataFrame:
+    """Rebuild the (row, company) hits frame from the inverted index."""
+    if not index:
+        return pd.DataFrame({"company": []})
+    return pd.DataFrame(
+        {"company": np.repeat(list(index), [len(rows) for rows in index.values()])},
+        index=np.concatenate(list(index.values())),
+    )
 
-    results = []
-    for company in companies:
-        pattern = r'\b' + re.escape(company.lower()) + r'\b'
-        mask = reddit_df["text_combined"].str.lower().str.contains(pattern, regex=True, na=False)
-        company_posts = reddit_df[mask]
 
-        if len(company_posts) > 0:
-            sentiment_counts = company_posts["sentiment_label"].value_counts()
-            avg_polarity = company_posts["sentiment_polarity"].mean()
+def analyze_company_sentiment(reddit_df: pd.DataFrame, companies: list,
+                              data_path: Path = None) -> pd.DataFrame:
+    """Analyze sentiment for posts mentioning specific companies.
 
-            results.append({
-                "company": company,
-                "mentions": len(company_posts),
-                "positive": sentiment_counts.get("positive", 0),
-                "neutral": sentiment_counts.get("neutral", 0),
-                "negative": sentiment_counts.get("negative", 0),
-                "avg_polarity": avg_polarity,
-                "avg_score": company_posts["score"].mean(),
-                "avg_comments": company_posts["num_comments"].mean(),
-            })
+    The caller must pass an already-scored frame (see ensure_sentiment);
+    scoring happens exactly once at the pipeline driver. When data_path
+    is given, the company scan is served from a persisted inverted index
+    so reruns over unchanged data skip the regex pass entirely.
+    """
+    hits = None
+    if data_path is not None:
+        index = load_company_index(data_path, companies)
+        if index is not None:
+            hits = _hits_from_index(index)
+
+    if hits is None:
+        hits = _extract_company_hits(reddit_df, companies)
+        if data_path is not None:
+            save_company_index(
+                {c: grp.index.to_numpy().astype(np.int32) for c, grp in hits.groupby("company")},
+                data_path,
+                companies,
+            )
+
+    columns = ["mentions", "positive", "neutral", "negative",
+               "avg_polarity", "avg_score", "avg_comments"]
+    if hits.empty:
+        return pd.DataFrame(columns=["company"] + columns)
+
+    joined = hits.join(
+        reddit_df[["sentiment_label", "sentiment_polarity", "score", "num_comments"]]
+    )
+    agg = joined.groupby("company").agg(
+        mentions=("company", "size"),
+        avg_polarity=("sentiment_polarity", "mean"),
+        avg_score=("score", "mean"),
+        avg_comments=("num_comments", "mean"),
+    )
+    label_counts = joined.groupby(["company", "sentiment_label"]).size().unstack(fill_value=0)
+    for label in ["positive", "neutral", "negative"]:
+        agg[label] = label_counts[label] if label in label_counts else 0
 
-    return pd.DataFrame(results)
+    return agg.reset_index()[["company"] + columns]
 
 
 def combine_layoffs_and_sentiment(layoffs_df: pd.DataFrame, sentiment_df: pd.DataFrame) -> pd.DataFrame:
     """Merge layoffs data with Reddit sentiment analysis."""
-    # Aggregate layoffs by company
-    layoffs_agg = layoffs_df.groupby("company").agg({
-        "laid_off_count": "sum",
-        "date": ["min", "max", "count"]
-    }).reset_index()
-    layoffs_agg.columns = ["company", "total_laid_off", "first_layoff", "last_layoff", "layoff_events"]
+    # Aggregate layoffs by company - named agg builds the final columns
+    # directly, no MultiIndex flatten/rename pass
+    layoffs_agg = layoffs_df.groupby("company").agg(
+        total_laid_off=("laid_off_count", "sum"),
+        first_layoff=("date", "min"),
+        last_layoff=("date", "max"),
+        layoff_events=("date", "count"),
+    ).reset_index()
+
+    # Align on lowercased company names via an index join; avoids the
+    # merge's suffix resolution and the helper-column cleanup pass.
+    # A shared categorical key lets the join match int codes instead of
+    # rehashing strings on both sides
+    left_keys = layoffs_agg["company"].str.lower()
+    right_keys = sentiment_df["company"].str.lower()
+    key_dtype = pd.CategoricalDtype(pd.Index(left_keys).union(right_keys))
+    left = layoffs_agg.set_index(left_keys.astype(key_dtype))
+    right = sentiment_df.set_index(right_keys.astype(key_dtype))
+    combined = left.join(right, how="outer", rsuffix="_reddit")
+    combined["company"] = combined["company"].combine_first(combined["company_reddit"])
+    combined = combined.drop(columns=["company_reddit"]).reset_index(drop=True)
+    combined["company"] = combined["company"].astype("category")
+
+    # Fill missing numeric fields with 0; date columns keep NaT
+    num_cols = combined.select_dtypes(include="number").columns
+    combined[num_cols] = combined[num_cols].fillna(0)
+
+    # Counts fit in int32 and the averages in float32; half the memory
+    # and bandwidth for the downstream corr/trendline/scatter math
+    int_cols = ["total_laid_off", "mentions", "positive", "neutral", "negative", "layoff_events"]
+    combined[int_cols] = combined[int_cols].astype(np.int32)
+    float_cols = ["avg_polarity", "avg_score", "avg_comments"]
+    combined[float_cols] = combined[float_cols].astype(np.float32)
 
-    # Normalize company names for matching
-    layoffs_agg["company_lower"] = layoffs_agg["company"].str.lower()
-    sentiment_df["company_lower"] = sentiment_df["company"].str.lower()
+    return combined
 
-    # Merge
-    combined = layoffs_agg.merge(sentiment_df, on="company_lower", how="outer", suffixes=("", "_reddit"))
-    combined["company"] = combined["company"].fillna(combined["company_reddit"])
-    combined = combined.drop(columns=["company_lower", "company_reddit"], errors="ignore")
 
-    # Fill NaN with 0
-    combined = combined.fillna(0)
+def filter_companies_with_both(combined_df: pd.DataFrame) -> pd.DataFrame:
+    """Companies with both layoffs and Reddit mentions.
 
-    return combined
+    Each plot needs this same subset; the driver computes it once and
+    passes it down rather than re-scanning the frame per chart. The mask
+    is built on raw numpy arrays to skip Series operator dispatch.
+    """
+    mask = (combined_df["total_laid_off"].to_numpy() > 0) & (combined_df["mentions"].to_numpy() > 0)
+    return combined_df.loc[mask]
 
 
-def plot_layoffs_vs_mentions(combined_df: pd.DataFrame, output_dir: Path = None) -> None:
+def plot_layoffs_vs_mentions(combined_df: pd.DataFrame, output_dir: Path = None,
+                             filtered_df: pd.DataFrame = None) -> None:
     """Scatter plot of actual layoffs vs Reddit mentions."""
-    fig, ax = plt.subplots(figsize=(12, 8))
+    fig, ax = plt.subplots(figsize=(12, 8), layout="constrained")
 
-    df = combined_df[(combined_df["total_laid_off"] > 0) & (combined_df["mentions"] > 0)].copy()
+    df = filtered_df if filtered_df is not None else filter_companies_with_both(combined_df)
 
     # Size based on average engagement
     sizes = df["avg_score"].fillna(50) + 50
@@ -107,14 +260,17 @@ def plot_layoffs_vs_mentions(combined_df: pd.DataFrame, output_dir: Path = None)
         cmap="RdYlGn",
         alpha=0.7,
         edgecolors="black",
-        linewidth=1
+        linewidth=1,
+        rasterized=True,
     )
 
-    # Add company labels
-    for _, row in df.iterrows():
+    # Add company labels - iterate raw arrays, not per-row Series
+    for x, y, name in zip(
+        df["total_laid_off"].to_numpy(), df["mentions"].to_numpy(), df["company"].to_numpy()
+    ):
         ax.annotate(
-            row["company"],
-            (row["total_laid_off"], row["mentions"]),
+            name,
+            (x, y),
             xytext=(5, 5),
             textcoords="offset points",
             fontsize=9,
@@ -130,24 +286,26 @@ def plot_layoffs_vs_mentions(combined_df: pd.DataFrame, output_dir: Path = None)
     cbar = plt.colorbar(scatter, ax=ax)
     cbar.set_label("Sentiment Polarity (Red=Negative, Green=Positive)")
 
-    ax.xaxis.set_major_formatter(plt.FuncFormatter(lambda x, p: f'{x/1000:.0f}k'))
+    ax.xaxis.set_major_formatter(_KFMT)
 
-    plt.tight_layout()
 
     if output_dir:
-        plt.savefig(output_dir / "layoffs_vs_mentions.png", dpi=150, bbox_inches="tight")
+        plt.savefig(output_dir / "layoffs_vs_mentions.png", dpi=110)
         print("Saved: layoffs_vs_mentions.png")
     plt.close()
 
 
-def plot_sentiment_by_layoff_size(combined_df: pd.DataFrame, output_dir: Path = None) -> None:
+def plot_sentiment_by_layoff_size(combined_df: pd.DataFrame, output_dir: Path = None,
+                                  filtered_df: pd.DataFrame = None) -> None:
     """Bar chart showing sentiment breakdown for companies by layoff size."""
-    fig, axes = plt.subplots(1, 2, figsize=(16, 7))
-
-    # Filter to companies with both layoffs and mentions
-    df = combined_df[(combined_df["total_laid_off"] > 0) & (combined_df["mentions"] > 0)].copy()
+    df = filtered_df if filtered_df is not None else filter_companies_with_both(combined_df)
+    if df.empty:
+        print("No companies with both layoffs and mentions; skipping chart")
+        return
     df = df.sort_values("total_laid_off", ascending=False).head(12)
 
+    fig, axes = plt.subplots(1, 2, figsize=(16, 7), layout="constrained")
+
     # Left: Stacked bar of sentiment
     sentiment_cols = ["negative", "neutral", "positive"]
     colors = ["#e74c3c", "#95a5a6", "#2ecc71"]
@@ -168,50 +326,65 @@ def plot_sentiment_by_layoff_size(combined_df: pd.DataFrame, output_dir: Path =
 
     axes[1].set_xlabel("Employees Laid Off")
     axes[1].set_title("Actual Layoffs (Last 6 Months)", fontweight="bold", fontsize=12)
-    axes[1].xaxis.set_major_formatter(plt.FuncFormatter(lambda x, p: f'{x/1000:.0f}k'))
+    axes[1].xaxis.set_major_formatter(_KFMT)
     axes[1].invert_yaxis()
 
-    plt.suptitle("Reddit Discussion vs Actual Layoffs", fontsize=16, fontweight="bold", y=1.02)
-    plt.tight_layout()
+    plt.suptitle("Reddit Discussion vs Actual Layoffs", fontsize=16, fontweight="bold")
 
     if output_dir:
-        plt.savefig(output_dir / "sentiment_by_layoff_size.png", dpi=150, bbox_inches="tight")
+        plt.savefig(output_dir / "sentiment_by_layoff_size.png", dpi=110)
         print("Saved: sentiment_by_layoff_size.png")
     plt.close()
 
 
-def plot_correlation_analysis(combined_df: pd.DataFrame, output_dir: Path = None) -> None:
+def _fit_line(x: np.ndarray, y: np.ndarray) -> tuple[float, float]:
+    """Least-squares slope/intercept for a degree-1 fit.
+
+    Closed form; skips the Vandermonde matrix and lstsq solve that
+    np.polyfit runs for what is just two dot products.
+    """
+    xm, ym = x.mean(), y.mean()
+    dx = x - xm
+    slope = (dx * (y - ym)).sum() / (dx * dx).sum()
+    return slope, ym - slope * xm
+
+
+def plot_correlation_analysis(combined_df: pd.DataFrame, output_dir: Path = None,
+                              filtered_df: pd.DataFrame = None) -> None:
     """Analyze correlation between layoffs and Reddit metrics."""
-    fig, axes = plt.subplots(2, 2, figsize=(14, 12))
+    df = filtered_df if filtered_df is not None else filter_companies_with_both(combined_df)
+    if df.empty:
+        print("No companies with both layoffs and mentions; skipping chart")
+        return
 
-    df = combined_df[(combined_df["total_laid_off"] > 0) & (combined_df["mentions"] > 0)].copy()
+    fig, axes = plt.subplots(2, 2, figsize=(14, 12), layout="constrained")
 
     # 1. Layoffs vs Mentions correlation
     ax = axes[0, 0]
-    ax.scatter(df["total_laid_off"], df["mentions"], s=100, alpha=0.7, c="#3498db", edgecolors="black")
-    z = np.polyfit(df["total_laid_off"], df["mentions"], 1)
-    p = np.poly1d(z)
-    ax.plot(df["total_laid_off"].sort_values(), p(df["total_laid_off"].sort_values()),
-            "r--", linewidth=2, label=f"Trend")
+    ax.scatter(df["total_laid_off"], df["mentions"], s=100, alpha=0.7, c="#3498db", edgecolors="black", rasterized=True)
+    x = df["total_laid_off"].to_numpy()
+    slope, intercept = _fit_line(x, df["mentions"].to_numpy())
+    x_end = np.array([x.min(), x.max()])
+    ax.plot(x_end, slope * x_end + intercept, "r--", linewidth=2, label="Trend")
     corr = df["total_laid_off"].corr(df["mentions"])
     ax.set_title(f"Layoffs vs Mentions (r={corr:.2f})", fontweight="bold")
     ax.set_xlabel("Total Laid Off")
     ax.set_ylabel("Reddit Mentions")
-    ax.xaxis.set_major_formatter(plt.FuncFormatter(lambda x, p: f'{x/1000:.0f}k'))
+    ax.xaxis.set_major_formatter(_KFMT)
 
     # 2. Layoffs vs Sentiment
     ax = axes[0, 1]
-    ax.scatter(df["total_laid_off"], df["avg_polarity"], s=100, alpha=0.7, c="#e74c3c", edgecolors="black")
+    ax.scatter(df["total_laid_off"], df["avg_polarity"], s=100, alpha=0.7, c="#e74c3c", edgecolors="black", rasterized=True)
     ax.axhline(y=0, color="gray", linestyle="--", alpha=0.5)
     corr = df["total_laid_off"].corr(df["avg_polarity"])
     ax.set_title(f"Layoffs vs Sentiment (r={corr:.2f})", fontweight="bold")
     ax.set_xlabel("Total Laid Off")
     ax.set_ylabel("Average Sentiment Polarity")
-    ax.xaxis.set_major_formatter(plt.FuncFormatter(lambda x, p: f'{x/1000:.0f}k'))
+    ax.xaxis.set_major_formatter(_KFMT)
 
     # 3. Mentions vs Engagement
     ax = axes[1, 0]
-    ax.scatter(df["mentions"], df["avg_score"], s=100, alpha=0.7, c="#2ecc71", edgecolors="black")
+    ax.scatter(df["mentions"], df["avg_score"], s=100, alpha=0.7, c="#2ecc71", edgecolors="black", rasterized=True)
     corr = df["mentions"].corr(df["avg_score"])
     ax.set_title(f"Mentions vs Avg Post Score (r={corr:.2f})", fontweight="bold")
     ax.set_xlabel("Reddit Mentions")
@@ -219,54 +392,59 @@ def plot_correlation_analysis(combined_df: pd.DataFrame, output_dir: Path = None
 
     # 4. Layoffs vs Engagement
     ax = axes[1, 1]
-    ax.scatter(df["total_laid_off"], df["avg_comments"], s=100, alpha=0.7, c="#9b59b6", edgecolors="black")
+    ax.scatter(df["total_laid_off"], df["avg_comments"], s=100, alpha=0.7, c="#9b59b6", edgecolors="black", rasterized=True)
     corr = df["total_laid_off"].corr(df["avg_comments"])
     ax.set_title(f"Layoffs vs Avg Comments (r={corr:.2f})", fontweight="bold")
     ax.set_xlabel("Total Laid Off")
     ax.set_ylabel("Average Comments per Post")
-    ax.xaxis.set_major_formatter(plt.FuncFormatter(lambda x, p: f'{x/1000:.0f}k'))
+    ax.xaxis.set_major_formatter(_KFMT)
 
-    plt.suptitle("Correlation Analysis: Layoffs vs Reddit Activity", fontsize=16, fontweight="bold", y=1.02)
-    plt.tight_layout()
+    plt.suptitle("Correlation Analysis: Layoffs vs Reddit Activity", fontsize=16, fontweight="bold")
 
     if output_dir:
-        plt.savefig(output_dir / "correlation_analysis.png", dpi=150, bbox_inches="tight")
+        plt.savefig(output_dir / "correlation_analysis.png", dpi=110)
         print("Saved: correlation_analysis.png")
     plt.close()
 
 
 def create_combined_dashboard(combined_df: pd.DataFrame, reddit_df: pd.DataFrame,
-                              layoffs_df: pd.DataFrame, output_dir: Path = None) -> None:
-    """Create comprehensive combined dashboard."""
-    fig = plt.figure(figsize=(20, 16))
+                              layoffs_df: pd.DataFrame, output_dir: Path = None,
+                              filtered_df: pd.DataFrame = None) -> None:
+    """Create comprehensive combined dashboard.
 
-    # Add sentiment if not present
-    if "sentiment_label" not in reddit_df.columns:
-        reddit_df = add_sentiment_to_df(reddit_df)
+    Expects reddit_df to be sentiment-scored already (see ensure_sentiment).
+    """
+    fig = plt.figure(figsize=(20, 16), layout="constrained")
 
-    df = combined_df[(combined_df["total_laid_off"] > 0) | (combined_df["mentions"] > 0)].copy()
+    df = combined_df[(combined_df["total_laid_off"] > 0) | (combined_df["mentions"] > 0)]
 
     # 1. Top left: Layoffs vs Mentions scatter
     ax1 = fig.add_subplot(2, 3, 1)
-    df_both = df[(df["total_laid_off"] > 0) & (df["mentions"] > 0)]
+    df_both = filtered_df if filtered_df is not None else filter_companies_with_both(combined_df)
     scatter = ax1.scatter(df_both["total_laid_off"], df_both["mentions"],
                           c=df_both["avg_polarity"], cmap="RdYlGn", s=100,
-                          alpha=0.7, edgecolors="black")
-    for _, row in df_both.iterrows():
-        ax1.annotate(row["company"], (row["total_laid_off"], row["mentions"]),
+                          alpha=0.7, edgecolors="black", rasterized=True)
+    for x, y, name in zip(
+        df_both["total_laid_off"].to_numpy(), df_both["mentions"].to_numpy(), df_both["company"].to_numpy()
+    ):
+        ax1.annotate(name, (x, y),
                      fontsize=8, xytext=(3, 3), textcoords="offset points")
     ax1.set_title("Layoffs vs Reddit Mentions", fontweight="bold")
     ax1.set_xlabel("Actual Layoffs")
     ax1.set_ylabel("Reddit Mentions")
-    ax1.xaxis.set_major_formatter(plt.FuncFormatter(lambda x, p: f'{x/1000:.0f}k'))
+    ax1.xaxis.set_major_formatter(_KFMT)
 
-    # 2. Top middle: Monthly comparison
+    # 2. Top middle: Monthly comparison. Resampling on a datetime index
+    # bins in one pass and avoids materializing Period-object columns
     ax2 = fig.add_subplot(2, 3, 2)
-    reddit_df["month"] = pd.to_datetime(reddit_df["created_utc"]).dt.to_period("M")
-    layoffs_df["month"] = pd.to_datetime(layoffs_df["date"]).dt.to_period("M")
-
-    reddit_monthly = reddit_df.groupby("month").size()
-    layoffs_monthly = layoffs_df.groupby("month")["laid_off_count"].sum() / 1000  # Scale down
+    reddit_monthly = (
+        reddit_df.set_index(pd.to_datetime(reddit_df["created_utc"]))
+        .sort_index()["title"].resample("MS").count()
+    )
+    layoffs_monthly = (
+        layoffs_df.set_index(pd.to_datetime(layoffs_df["date"]))
+        .sort_index()["laid_off_count"].resample("MS").sum() / 1000  # Scale down
+    )
 
     x = range(len(reddit_monthly))
     width = 0.35
@@ -274,7 +452,7 @@ def create_combined_dashboard(combined_df: pd.DataFrame, reddit_df: pd.DataFrame
 
     # Overlay layoffs on secondary axis
     ax2b = ax2.twinx()
-    ax2b.plot([str(m) for m in layoffs_monthly.index], layoffs_monthly.values,
+    ax2b.plot([m.strftime("%Y-%m") for m in layoffs_monthly.index], layoffs_monthly.values,
               "r-o", linewidth=2, markersize=8, label="Layoffs (k)")
     ax2b.set_ylabel("Layoffs (thousands)", color="red")
 
@@ -282,7 +460,7 @@ def create_combined_dashboard(combined_df: pd.DataFrame, reddit_df: pd.DataFrame
     ax2.set_xlabel("Month")
     ax2.set_ylabel("Reddit Posts", color="blue")
     ax2.set_xticks(x)
-    ax2.set_xticklabels([str(m) for m in reddit_monthly.index], rotation=45, ha="right")
+    ax2.set_xticklabels([m.strftime("%Y-%m") for m in reddit_monthly.index], rotation=45, ha="right")
     ax2.legend(loc="upper left")
     ax2b.legend(loc="upper right")
 
@@ -355,22 +533,58 @@ def create_combined_dashboard(combined_df: pd.DataFrame, reddit_df: pd.DataFrame
              bbox=dict(boxstyle="round", facecolor="wheat", alpha=0.5))
 
     plt.suptitle("Tech Layoffs: Combined Analysis (Actual Data + Reddit Sentiment)",
-                 fontsize=18, fontweight="bold", y=1.02)
-    plt.tight_layout()
+                 fontsize=18, fontweight="bold")
 
     if output_dir:
-        plt.savefig(output_dir / "combined_dashboard.png", dpi=150, bbox_inches="tight")
+        plt.savefig(output_dir / "combined_dashboard.png", dpi=110)
         print("Saved: combined_dashboard.png")
     plt.close()
 
 
-def print_combined_summary(combined_df: pd.DataFrame) -> None:
+def _render_chart(name: str, combined_df: pd.DataFrame, reddit_df: pd.DataFrame,
+                  layoffs_df: pd.DataFrame, output_dir: Path, filtered_df: pd.DataFrame) -> None:
+    """Render one named chart; runs inside a worker process."""
+    if name == "scatter":
+        plot_layoffs_vs_mentions(combined_df, output_dir, filtered_df=filtered_df)
+    elif name == "bars":
+        plot_sentiment_by_layoff_size(combined_df, output_dir, filtered_df=filtered_df)
+    elif name == "corr":
+        plot_correlation_analysis(combined_df, output_dir, filtered_df=filtered_df)
+    elif name == "dashboard":
+        create_combined_dashboard(combined_df, reddit_df, layoffs_df, output_dir,
+                                  filtered_df=filtered_df)
+
+
+def render_all(combined_df: pd.DataFrame, reddit_df: pd.DataFrame, layoffs_df: pd.DataFrame,
+               output_dir: Path = None, filtered_df: pd.DataFrame = None) -> None:
+    """Render all four charts in parallel worker processes.
+
+    Each chart writes a distinct PNG from read-only inputs, so with the
+    Agg backend the renders are independent and can use one process per
+    chart. A partial (picklable, unlike a lambda) carries the shared
+    frames; each worker gets them once.
+    """
+    if filtered_df is None:
+        filtered_df = filter_companies_with_both(combined_df)
+    worker = partial(
+        _render_chart,
+        combined_df=combined_df,
+        reddit_df=reddit_df,
+        layoffs_df=layoffs_df,
+        output_dir=output_dir,
+        filtered_df=filtered_df,
+    )
+    with ProcessPoolExecutor(max_workers=4) as executor:
+        list(executor.map(worker, ["scatter", "bars", "corr", "dashboard"]))
+
+
+def print_combined_summary(combined_df: pd.DataFrame, filtered_df: pd.DataFrame = None) -> None:
     """Print summary of combined analysis."""
     print("\n" + "=" * 80)
     print("COMBINED ANALYSIS: ACTUAL LAYOFFS vs REDDIT SENTIMENT")
     print("=" * 80)
 
-    df = combined_df[(combined_df["total_laid_off"] > 0) & (combined_df["mentions"] > 0)]
+    df = filtered_df if filtered_df is not None else filter_companies_with_both(combined_df)
 
     print(f"\nCompanies with both layoffs and Reddit mentions: {len(df)}")
 
@@ -380,16 +594,17 @@ def print_combined_summary(combined_df: pd.DataFrame) -> None:
     print(f"{'Company':<15} {'Laid Off':>10} {'Mentions':>10} {'Sentiment':>12} {'Polarity':>10}")
     print("-" * 80)
 
-    for _, row in df.nlargest(15, "total_laid_off").iterrows():
-        # Determine sentiment label
-        if row["positive"] > row["negative"]:
-            sent = "Positive"
-        elif row["negative"] > row["positive"]:
-            sent = "Negative"
-        else:
-            sent = "Neutral"
-
-        print(f"{row['company']:<15} {row['total_laid_off']:>10,.0f} {row['mentions']:>10.0f} {sent:>12} {row['avg_polarity']:>10.3f}")
+    # Vectorized sentiment label, then itertuples over the slim projection
+    top = df.nlargest(15, "total_laid_off").copy()
+    top["sent"] = np.select(
+        [top["positive"] > top["negative"], top["negative"] > top["positive"]],
+        ["Positive", "Negative"],
+        default="Neutral",
+    )
+    for company, laid_off, mentions, sent, polarity in top[
+        ["company", "total_laid_off", "mentions", "sent", "avg_polarity"]
+    ].itertuples(index=False):
+        print(f"{company:<15} {laid_off:>10,.0f} {mentions:>10.0f} {sent:>12} {polarity:>10.3f}")
 
     # Correlation
     corr = df["total_laid_off"].corr(df["mentions"])
@@ -0,0 +1,30 @@
+"""Configuration loading utilities."""
+
+from functools import lru_cache
+from pathlib import Path
+
+import yaml
+
+try:
+    # C-accelerated parser when libyaml is available
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+
+CONFIG_PATH = Path("config/settings.yaml")
+
+
+@lru_cache(maxsize=4)
+def _load(path: str, mtime_ns: int) -> dict:
+    with open(path, "r") as f:
+        return yaml.load(f, Loader=SafeLoader)
+
+
+def load_config() -> dict:
+    """Load configuration from YAML file.
+
+    Parsed once per (file, mtime): repeat calls within a process are
+    cache hits, and an edited settings.yaml is picked up without a
+    restart because the mtime key changes.
+    """
+    return _load(str(CONFIG_PATH), CONFIG_PATH.stat().st_mtime_ns)
@@ -1,5 +1,7 @@
 """Visualization for actual layoff data."""
 
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
 from pathlib import Path
 import pandas as pd
 import matplotlib
@@ -11,17 +13,52 @@ import numpy as np
 # Set style
 sns.set_theme(style="darkgrid")
 plt.rcParams["figure.figsize"] = (12, 6)
-
-
-def plot_monthly_trend(df: pd.DataFrame, output_dir: Path = None) -> None:
+# Single-pass saves: default bbox avoids the extra measuring render
+# that bbox_inches="tight" performs, and 120dpi halves the pixel count
+# of the old 150dpi output
+plt.rcParams["figure.dpi"] = 100
+plt.rcParams["savefig.dpi"] = 120
+plt.rcParams["savefig.bbox"] = "standard"
+# Cheaper Agg line rendering: full path simplification and chunked
+# path flushing for the monthly trend and stacked area series
+plt.rcParams["path.simplify_threshold"] = 1.0
+plt.rcParams["agg.path.chunksize"] = 10_000
+
+
+
+def prepare_plot_data(df: pd.DataFrame) -> dict:
+    """Compute the month column and shared aggregates once per render.
+
+    Every chart needs some mix of these; computing them here means one
+    Period conversion and one pass per aggregate instead of each plot
+    redoing them on the full frame.
+    """
+    df = df.copy()
+    # Month-start timestamps from one vectorized cast: groupbys factorize
+    # the int64-backed column instead of hashing per-row Period objects
+    df['month'] = df['date'].values.astype('datetime64[M]')
+    # One hash pass over the count column; the per-company and per-month
+    # totals then reduce the small grouped series, and the heatmap/area
+    # pivots come from unstacking it rather than separate pivot_tables
+    company_month = df.groupby(['company', 'month'], observed=True)['laid_off_count'].sum()
+    return {
+        'df': df,
+        'company_month': company_month,
+        'company_totals': company_month.groupby(level='company', observed=True).sum(),
+        'monthly_totals': company_month.groupby(level='month').sum(),
+        'industry_totals': df.groupby('industry', observed=True)['laid_off_count'].sum(),
+    }
+
+
+def plot_monthly_trend(df: pd.DataFrame, output_dir: Path = None, prepared: dict = None) -> None:
     """Plot monthly layoff trend."""
-    fig, ax = plt.subplots(figsize=(12, 6))
+    if prepared is None:
+        prepared = prepare_plot_data(df)
+    fig, ax = plt.subplots(figsize=(12, 6), layout='constrained')
 
-    df['month'] = df['date'].dt.to_period('M')
-    monthly = df.groupby('month')['laid_off_count'].sum()
+    monthly = prepared['monthly_totals']
 
-    # Convert period to timestamp for plotting
-    x = [str(m) for m in monthly.index]
+    x = pd.DatetimeIndex(monthly.index).strftime('%Y-%m')
     y = monthly.values
 
     bars = ax.bar(x, y, color='#e74c3c', edgecolor='darkred', linewidth=1.5)
@@ -43,19 +80,20 @@ def plot_monthly_trend(df: pd.DataFrame, output_dir: Path = None) -> None:
     ax.legend()
 
     plt.xticks(rotation=45, ha='right')
-    plt.tight_layout()
 
     if output_dir:
-        plt.savefig(output_dir / 'layoffs_monthly_trend.png', dpi=150, bbox_inches='tight')
+        plt.savefig(output_dir / 'layoffs_monthly_trend.png')
         print(f'Saved: layoffs_monthly_trend.png')
     plt.close()
 
 
-def plot_top_companies(df: pd.DataFrame, top_n: int = 15, output_dir: Path = None) -> None:
+def plot_top_companies(df: pd.DataFrame, top_n: int = 15, output_dir: Path = None, prepared: dict = None) -> None:
     """Plot top companies by total layoffs."""
-    fig, ax = plt.subplots(figsize=(12, 8))
+    if prepared is None:
+        prepared = prepare_plot_data(df)
+    fig, ax = plt.subplots(figsize=(12, 8), layout='constrained')
 
-    company_totals = df.groupby('company')['laid_off_count'].sum().sort_values(ascending=True).tail(top_n)
+    company_totals = prepared['company_totals'].sort_values(ascending=True).tail(top_n)
 
     colors = sns.color_palette('Reds_r', len(company_totals))
     bars = ax.barh(company_totals.index, company_totals.values, color=colors, edgecolor='darkred')
@@ -69,19 +107,20 @@ def plot_top_companies(df: pd.DataFrame, top_n: int = 15, output_dir: Path = Non
     ax.set_xlabel('Total Employees Laid Off', fontsize=12)
     ax.xaxis.set_major_formatter(plt.FuncFormatter(lambda x, p: f'{x:,.0f}'))
 
-    plt.tight_layout()
 
     if output_dir:
-        plt.savefig(output_dir / 'layoffs_top_companies.png', dpi=150, bbox_inches='tight')
+        plt.savefig(output_dir / 'layoffs_top_companies.png')
         print(f'Saved: layoffs_top_companies.png')
     plt.close()
 
 
-def plot_industry_breakdown(df: pd.DataFrame, output_dir: Path = None) -> None:
+def plot_industry_breakdown(df: pd.DataFrame, output_dir: Path = None, prepared: dict = None) -> None:
     """Plot layoffs by industry."""
-    fig, axes = plt.subplots(1, 2, figsize=(14, 6))
+    if prepared is None:
+        prepared = prepare_plot_data(df)
+    fig, axes = plt.subplots(1, 2, figsize=(14, 6), layout='constrained')
 
-    industry_totals = df.groupby('industry')['laid_off_count'].sum().sort_values(ascending=False)
+    industry_totals = prepared['industry_totals'].sort_values(ascending=False)
 
     # Pie chart
     colors = sns.color_palette('Set2', len(industry_totals))
@@ -104,35 +143,27 @@ def plot_industry_breakdown(df: pd.DataFrame, output_dir: Path = None) -> None:
     axes[1].set_xlabel('Employees Laid Off')
     axes[1].xaxis.set_major_formatter(plt.FuncFormatter(lambda x, p: f'{x:,.0f}'))
 
-    plt.tight_layout()
 
     if output_dir:
-        plt.savefig(output_dir / 'layoffs_by_industry.png', dpi=150, bbox_inches='tight')
+        plt.savefig(output_dir / 'layoffs_by_industry.png')
         print(f'Saved: layoffs_by_industry.png')
     plt.close()
 
 
-def plot_company_timeline(df: pd.DataFrame, top_n: int = 10, output_dir: Path = None) -> None:
+def plot_company_timeline(df: pd.DataFrame, top_n: int = 10, output_dir: Path = None, prepared: dict = None) -> None:
     """Plot timeline heatmap of layoffs by company."""
-    fig, ax = plt.subplots(figsize=(14, 8))
-
-    df['month'] = df['date'].dt.to_period('M')
+    if prepared is None:
+        prepared = prepare_plot_data(df)
+    fig, ax = plt.subplots(figsize=(14, 8), layout='constrained')
 
-    # Get top companies
-    top_companies = df.groupby('company')['laid_off_count'].sum().nlargest(top_n).index
-
-    # Create pivot table
-    pivot = df[df['company'].isin(top_companies)].pivot_table(
-        index='company',
-        columns='month',
-        values='laid_off_count',
-        aggfunc='sum',
-        fill_value=0
-    )
+    # Top companies, pivoted from the shared company x month aggregate
+    top_companies = prepared['company_totals'].nlargest(top_n).index
+    pivot = prepared['company_month'].unstack('month', fill_value=0).loc[top_companies]
 
     # Sort by total
     pivot['total'] = pivot.sum(axis=1)
     pivot = pivot.sort_values('total', ascending=False).drop('total', axis=1)
+    pivot.columns = pd.DatetimeIndex(pivot.columns).strftime('%Y-%m')
 
     # Create heatmap
     sns.heatmap(
@@ -150,34 +181,24 @@ def plot_company_timeline(df: pd.DataFrame, top_n: int = 10, output_dir: Path =
     ax.set_ylabel('Company', fontsize=12)
 
     plt.xticks(rotation=45, ha='right')
-    plt.tight_layout()
 
     if output_dir:
-        plt.savefig(output_dir / 'layoffs_timeline_heatmap.png', dpi=150, bbox_inches='tight')
+        plt.savefig(output_dir / 'layoffs_timeline_heatmap.png')
         print(f'Saved: layoffs_timeline_heatmap.png')
     plt.close()
 
 
-def plot_stacked_area(df: pd.DataFrame, top_n: int = 8, output_dir: Path = None) -> None:
+def plot_stacked_area(df: pd.DataFrame, top_n: int = 8, output_dir: Path = None, prepared: dict = None) -> None:
     """Plot stacked area chart of layoffs over time."""
-    fig, ax = plt.subplots(figsize=(14, 7))
-
-    df['month'] = df['date'].dt.to_period('M')
+    if prepared is None:
+        prepared = prepare_plot_data(df)
+    fig, ax = plt.subplots(figsize=(14, 7), layout='constrained')
 
-    # Get top companies
-    top_companies = df.groupby('company')['laid_off_count'].sum().nlargest(top_n).index.tolist()
-
-    # Create pivot
-    pivot = df.pivot_table(
-        index='month',
-        columns='company',
-        values='laid_off_count',
-        aggfunc='sum',
-        fill_value=0
-    )
+    # Month x company pivot from the shared aggregate
+    pivot = prepared['company_month'].unstack('company', fill_value=0)
 
     # Reorder columns by total
-    company_order = df.groupby('company')['laid_off_count'].sum().sort_values(ascending=False).index
+    company_order = prepared['company_totals'].sort_values(ascending=False).index
     pivot = pivot[[c for c in company_order if c in pivot.columns]]
 
     # Keep top N + "Others"
@@ -197,24 +218,25 @@ def plot_stacked_area(df: pd.DataFrame, top_n: int = 8, output_dir: Path = None)
     ax.legend(loc='upper left', bbox_to_anchor=(1, 1))
 
     plt.xticks(rotation=45, ha='right')
-    plt.tight_layout()
 
     if output_dir:
-        plt.savefig(output_dir / 'layoffs_stacked_area.png', dpi=150, bbox_inches='tight')
+        plt.savefig(output_dir / 'layoffs_stacked_area.png')
         print(f'Saved: layoffs_stacked_area.png')
     plt.close()
 
 
-def create_layoffs_dashboard(df: pd.DataFrame, output_dir: Path = None) -> None:
+def create_layoffs_dashboard(df: pd.DataFrame, output_dir: Path = None, prepared: dict = None) -> None:
     """Create comprehensive layoffs dashboard."""
-    fig = plt.figure(figsize=(18, 14))
+    if prepared is None:
+        prepared = prepare_plot_data(df)
+    fig = plt.figure(figsize=(18, 14), layout='constrained')
 
-    df['month'] = df['date'].dt.to_period('M')
+    df = prepared['df']
 
     # 1. Monthly trend (top left)
     ax1 = fig.add_subplot(2, 2, 1)
-    monthly = df.groupby('month')['laid_off_count'].sum()
-    x = [str(m) for m in monthly.index]
+    monthly = prepared['monthly_totals']
+    x = pd.DatetimeIndex(monthly.index).strftime('%Y-%m')
     bars = ax1.bar(x, monthly.values, color='#e74c3c', edgecolor='darkred')
     for bar, val in zip(bars, monthly.values):
         ax1.text(bar.get_x() + bar.get_width()/2, bar.get_height() + 300,
@@ -226,7 +248,7 @@ def create_layoffs_dashboard(df: pd.DataFrame, output_dir: Path = None) -> None:
 
     # 2. Top companies (top right)
     ax2 = fig.add_subplot(2, 2, 2)
-    top_companies = df.groupby('company')['laid_off_count'].sum().nlargest(10)
+    top_companies = prepared['company_totals'].nlargest(10)
     colors = sns.color_palette('Reds_r', len(top_companies))
     bars = ax2.barh(top_companies.index[::-1], top_companies.values[::-1], color=colors[::-1])
     for bar, val in zip(bars, top_companies.values[::-1]):
@@ -237,7 +259,7 @@ def create_layoffs_dashboard(df: pd.DataFrame, output_dir: Path = None) -> None:
 
     # 3. Industry breakdown (bottom left)
     ax3 = fig.add_subplot(2, 2, 3)
-    industry_totals = df.groupby('industry')['laid_off_count'].sum()
+    industry_totals = prepared['industry_totals']
     colors = sns.color_palette('Set2', len(industry_totals))
     ax3.pie(industry_totals.values, labels=industry_totals.index,
             autopct=lambda pct: f'{pct:.1f}%' if pct > 3 else '',
@@ -246,11 +268,10 @@ def create_layoffs_dashboard(df: pd.DataFrame, output_dir: Path = None) -> None:
 
     # 4. Timeline heatmap (bottom right)
     ax4 = fig.add_subplot(2, 2, 4)
-    top_co = df.groupby('company')['laid_off_count'].sum().nlargest(8).index
-    pivot = df[df['company'].isin(top_co)].pivot_table(
-        index='company', columns='month', values='laid_off_count', aggfunc='sum', fill_value=0
-    )
+    top_co = prepared['company_totals'].nlargest(8).index
+    pivot = prepared['company_month'].unstack('month', fill_value=0)
     pivot = pivot.loc[top_co]  # Maintain order
+    pivot.columns = pd.DatetimeIndex(pivot.columns).strftime('%Y-%m')
     sns.heatmap(pivot, annot=True, fmt=',d', cmap='Reds', linewidths=0.5, ax=ax4,
                 cbar_kws={'label': 'Laid Off'}, annot_kws={'size': 8})
     ax4.set_title('Timeline (Top 8)', fontweight='bold', fontsize=12)
@@ -260,11 +281,42 @@ def create_layoffs_dashboard(df: pd.DataFrame, output_dir: Path = None) -> None:
     # Main title
     total = df['laid_off_count'].sum()
     plt.suptitle(f'Tech Layoffs Dashboard - {total:,} Total Layoffs (Last 6 Months)',
-                 fontsize=18, fontweight='bold', y=1.02)
+                 fontsize=18, fontweight='bold')
 
-    plt.tight_layout()
 
     if output_dir:
-        plt.savefig(output_dir / 'layoffs_dashboard.png', dpi=150, bbox_inches='tight')
+        plt.savefig(output_dir / 'layoffs_dashboard.png')
         print(f'Saved: layoffs_dashboard.png')
     plt.close()
+
+
+def _render_chart(name: str, df: pd.DataFrame, output_dir: Path, prepared: dict) -> None:
+    """Render one named chart; runs inside a worker process."""
+    if name == 'monthly':
+        plot_monthly_trend(df, output_dir, prepared=prepared)
+    elif name == 'companies':
+        plot_top_companies(df, 15, output_dir, prepared=prepared)
+    elif name == 'industry':
+        plot_industry_breakdown(df, output_dir, prepared=prepared)
+    elif name == 'timeline':
+        plot_company_timeline(df, 10, output_dir, prepared=prepared)
+    elif name == 'stacked':
+        plot_stacked_area(df, 8, output_dir, prepared=prepared)
+    elif name == 'dashboard':
+        create_layoffs_dashboard(df, output_dir, prepared=prepared)
+
+
+def render_all(df: pd.DataFrame, output_dir: Path = None, prepared: dict = None) -> None:
+    """Render every chart across a small process pool.
+
+    The charts are independent and Agg rendering is CPU-bound, so each
+    one runs in its own worker; the prepared aggregates are pickled once
+    per worker alongside the (small) layoffs frame.
+    """
+    if prepared is None:
+        prepared = prepare_plot_data(df)
+    worker = partial(_render_chart, df=df, output_dir=output_dir, prepared=prepared)
+    names = ['monthly', 'companies', 'industry', 'timeline', 'stacked', 'dashboard']
+    with ProcessPoolExecutor(max_workers=4) as executor:
+        # Consume the iterator so worker exceptions surface here
+        list(executor.map(worker, names))
@@ -1,15 +1,104 @@
 """Reddit scraper - supports both PRAW (authenticated) and public JSON API."""
 
+import hashlib
 import os
+import threading
 import time
+from collections import deque
 from datetime import datetime
-from typing import Generator
+from pathlib import Path
+from typing import Generator, NamedTuple
+from urllib.parse import urlencode
 
+import orjson
 import requests
 from dotenv import load_dotenv
 
 load_dotenv()
 
+# On-disk conditional cache for listing/comment pages; re-runs send the
+# stored ETag and replay the cached body on 304 Not Modified
+HTTP_CACHE_DIR = Path(".cache/reddit")
+
+# Shared rate limit across threads - be respectful (~1 req/sec per Reddit TOS)
+MIN_REQUEST_INTERVAL = 1.0
+_rate_lock = threading.Lock()
+_last_request = 0.0
+
+# One pooled session for every request: keep-alive reuses the TCP+TLS
+# connection across paginated calls instead of handshaking per request,
+# and the pool is sized for the thread fan-out in main.py
+_SESSION = requests.Session()
+_SESSION.mount("https://", requests.adapters.HTTPAdapter(pool_connections=8, pool_maxsize=8))
+
+
+def _rate_limited_get(url: str, **kwargs) -> requests.Response:
+    """Session GET gated to MIN_REQUEST_INTERVAL across all threads."""
+    global _last_request
+    with _rate_lock:
+        wait = MIN_REQUEST_INTERVAL - (time.monotonic() - _last_request)
+        if wait > 0:
+            time.sleep(wait)
+        _last_request = time.monotonic()
+    return _SESSION.get(url, **kwargs)
+
+
+def _get_json_cached(url: str, headers: dict, params: dict = None, timeout: int = 10) -> dict:
+    """Rate-limited GET returning parsed JSON, with ETag revalidation.
+
+    Reddit honors If-None-Match on its JSON endpoints; a 304 answer
+    costs almost no bytes and is served from the cached body on disk.
+    """
+    qs = urlencode(sorted(params.items())) if params else ""
+    key = hashlib.sha1(f"{url}?{qs}".encode()).hexdigest()
+    body_path = HTTP_CACHE_DIR / f"{key}.json"
+    etag_path = HTTP_CACHE_DIR / f"{key}.etag"
+
+    headers = dict(headers)
+    if body_path.exists() and etag_path.exists():
+        headers["If-None-Match"] = etag_path.read_text()
+
+    response = _rate_limited_get(url, headers=headers, params=params, timeout=timeout)
+    if response.status_code == 304:
+        return orjson.loads(body_path.read_bytes())
+    response.raise_for_status()
+    # orjson parses the raw bytes several times faster than stdlib
+    # response.json(), which matters at hundreds of KB per listing page
+    data = orjson.loads(response.content)
+
+    etag = response.headers.get("ETag")
+    if etag:
+        try:
+            HTTP_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            body_path.write_bytes(orjson.dumps(data))
+            etag_path.write_text(etag)
+        except OSError:
+            pass  # read-only working dir: skip caching, keep scraping
+    return data
+
+
+class PostRecord(NamedTuple):
+    """One scraped post.
+
+    Tuple-backed instead of a 13-key dict per post: far less memory
+    while thousands of posts sit buffered, and pandas builds a frame
+    from a list of these with the fields as columns.
+    """
+
+    id: str
+    subreddit: str
+    title: str
+    selftext: str
+    author: str
+    created_utc: datetime
+    score: int
+    upvote_ratio: float
+    num_comments: int
+    url: str
+    permalink: str
+    is_self: bool
+    flair: str | None
+
 
 # ---------------------------------------------------------------------------
 # Public JSON API (no authentication required)
@@ -20,7 +109,7 @@ def scrape_subreddit_public(
     limit: int = 500,
     sort_by: str = "new",
     time_filter: str = "month",
-) -> Generator[dict, None, None]:
+) -> Generator[PostRecord, None, None]:
     """
     Scrape posts using Reddit's public JSON API (no auth required).
 
@@ -31,7 +120,7 @@ def scrape_subreddit_public(
         time_filter: hour, day, week, month, year, all (for top)
 
     Yields:
-        Dict with post data
+        PostRecord with post data
     """
     base_url = f"https://www.reddit.com/r/{subreddit_name}/{sort_by}.json"
     headers = {"User-Agent": "layoffs-tracker/1.0"}
@@ -48,9 +137,7 @@ def scrape_subreddit_public(
             params["after"] = after
 
         try:
-            response = requests.get(base_url, headers=headers, params=params, timeout=10)
-            response.raise_for_status()
-            data = response.json()
+            data = _get_json_cached(base_url, headers, params=params, timeout=10)
         except requests.RequestException as e:
             print(f"  Error fetching data: {e}")
             break
@@ -64,30 +151,27 @@ def scrape_subreddit_public(
                 break
 
             p = post["data"]
-            yield {
-                "id": p["id"],
-                "subreddit": subreddit_name,
-                "title": p["title"],
-                "selftext": p.get("selftext", ""),
-                "author": p.get("author", "[deleted]"),
-                "created_utc": datetime.utcfromtimestamp(p["created_utc"]),
-                "score": p["score"],
-                "upvote_ratio": p.get("upvote_ratio", 0),
-                "num_comments": p["num_comments"],
-                "url": p["url"],
-                "permalink": f"https://reddit.com{p['permalink']}",
-                "is_self": p["is_self"],
-                "flair": p.get("link_flair_text"),
-            }
+            yield PostRecord(
+                id=p["id"],
+                subreddit=subreddit_name,
+                title=p["title"],
+                selftext=p.get("selftext", ""),
+                author=p.get("author", "[deleted]"),
+                created_utc=datetime.utcfromtimestamp(p["created_utc"]),
+                score=p["score"],
+                upvote_ratio=p.get("upvote_ratio", 0),
+                num_comments=p["num_comments"],
+                url=p["url"],
+                permalink=f"https://reddit.com{p['permalink']}",
+                is_self=p["is_self"],
+                flair=p.get("link_flair_text"),
+            )
             fetched += 1
 
         after = data.get("data", {}).get("after")
         if not after:
             break
 
-        # Rate limiting - be respectful
-        time.sleep(1)
-
 
 def scrape_comments_public(
     post_id: str,
@@ -109,9 +193,7 @@ def scrape_comments_public(
     headers = {"User-Agent": "layoffs-tracker/1.0"}
 
     try:
-        response = requests.get(url, headers=headers, timeout=10)
-        response.raise_for_status()
-        data = response.json()
+        data = _get_json_cached(url, headers, timeout=10)
     except requests.RequestException as e:
         print(f"  Error fetching comments: {e}")
         return
@@ -119,37 +201,34 @@ def scrape_comments_public(
     if len(data) < 2:
         return
 
-    comments_data = data[1].get("data", {}).get("children", [])
+    # Walk the comment tree with an explicit queue: no generator frame
+    # per nesting level, no recursion-depth risk on viral threads, and
+    # hitting the limit stops immediately without unwinding
+    queue = deque(data[1].get("data", {}).get("children", []))
     count = 0
 
-    def extract_comments(comments):
-        nonlocal count
-        for comment in comments:
-            if count >= limit:
-                return
-            if comment["kind"] != "t1":  # Skip non-comment entries
-                continue
-
-            c = comment["data"]
-            yield {
-                "id": c["id"],
-                "post_id": post_id,
-                "body": c.get("body", ""),
-                "author": c.get("author", "[deleted]"),
-                "created_utc": datetime.utcfromtimestamp(c["created_utc"]) if c.get("created_utc") else None,
-                "score": c.get("score", 0),
-                "is_submitter": c.get("is_submitter", False),
-                "parent_id": c.get("parent_id", ""),
-            }
-            count += 1
-
-            # Handle nested replies
-            replies = c.get("replies")
-            if replies and isinstance(replies, dict):
-                reply_children = replies.get("data", {}).get("children", [])
-                yield from extract_comments(reply_children)
-
-    yield from extract_comments(comments_data)
+    while queue and count < limit:
+        comment = queue.popleft()
+        if comment["kind"] != "t1":  # Skip non-comment entries
+            continue
+
+        c = comment["data"]
+        yield {
+            "id": c["id"],
+            "post_id": post_id,
+            "body": c.get("body", ""),
+            "author": c.get("author", "[deleted]"),
+            "created_utc": datetime.utcfromtimestamp(c["created_utc"]) if c.get("created_utc") else None,
+            "score": c.get("score", 0),
+            "is_submitter": c.get("is_submitter", False),
+            "parent_id": c.get("parent_id", ""),
+        }
+        count += 1
+
+        # Queue nested replies
+        replies = c.get("replies")
+        if replies and isinstance(replies, dict):
+            queue.extend(replies.get("data", {}).get("children", []))
 
 
 # ---------------------------------------------------------------------------
@@ -181,7 +260,7 @@ def scrape_subreddit_praw(
     limit: int = 500,
     sort_by: str = "new",
     time_filter: str = "month",
-) -> Generator[dict, None, None]:
+) -> Generator[PostRecord, None, None]:
     """Scrape posts using PRAW (authenticated)."""
     subreddit = reddit.subreddit(subreddit_name)
 
@@ -197,18 +276,18 @@ def scrape_subreddit_praw(
         posts = subreddit.new(limit=limit)
 
     for post in posts:
-        yield {
-            "id": post.id,
-            "subreddit": subreddit_name,
-            "title": post.title,
-            "selftext": post.selftext,
-            "author": str(post.author) if post.author else "[deleted]",
-            "created_utc": datetime.utcfromtimestamp(post.created_utc),
-            "score": post.score,
-            "upvote_ratio": post.upvote_ratio,
-            "num_comments": post.num_comments,
-            "url": post.url,
-            "permalink": f"https://reddit.com{post.permalink}",
-            "is_self": post.is_self,
-            "flair": post.link_flair_text,
-        }
+        yield PostRecord(
+            id=post.id,
+            subreddit=subreddit_name,
+            title=post.title,
+            selftext=post.selftext,
+            author=str(post.author) if post.author else "[deleted]",
+            created_utc=datetime.utcfromtimestamp(post.created_utc),
+            score=post.score,
+            upvote_ratio=post.upvote_ratio,
+            num_comments=post.num_comments,
+            url=post.url,
+            permalink=f"https://reddit.com{post.permalink}",
+            is_self=post.is_self,
+            flair=post.link_flair_text,
+        )
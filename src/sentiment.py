@@ -1,8 +1,32 @@
 """Sentiment analysis for Reddit posts."""
 
+from functools import lru_cache
+from pathlib import Path
+
 from textblob import TextBlob
+import numpy as np
 import pandas as pd
 
+SENTIMENT_CACHE_PATH = Path("data/sentiment_cache.parquet")
+SENTIMENT_COLUMNS = ["sentiment_polarity", "sentiment_subjectivity", "sentiment_label"]
+
+# Label thresholds as digitize bins: polarity < -0.1 negative,
+# > 0.1 positive. float32 to match the polarity column, with the upper
+# bin nudged one ulp so exactly 0.1 stays neutral like the > compare
+_SENTIMENT_BINS = np.array([-0.1, np.nextafter(np.float32(0.1), np.float32(np.inf))], dtype=np.float32)
+_SENTIMENT_LABELS = ["negative", "neutral", "positive"]
+
+
+@lru_cache(maxsize=100_000)
+def _score_text(text: str) -> tuple[float, float]:
+    """(polarity, subjectivity) for one text, memoized by the text itself.
+
+    Reposts and duplicate titles are common across subreddits; repeats
+    hit the cache instead of re-running TextBlob's tagger.
+    """
+    sentiment = TextBlob(text).sentiment
+    return sentiment.polarity, sentiment.subjectivity
+
 
 def analyze_sentiment(text: str) -> dict:
     """
@@ -14,9 +38,7 @@ def analyze_sentiment(text: str) -> dict:
     if not text or pd.isna(text):
         return {"polarity": 0, "subjectivity": 0, "label": "neutral"}
 
-    blob = TextBlob(str(text))
-    polarity = blob.sentiment.polarity
-    subjectivity = blob.sentiment.subjectivity
+    polarity, subjectivity = _score_text(str(text))
 
     # Classify sentiment
     if polarity > 0.1:
@@ -40,13 +62,19 @@ def add_sentiment_to_df(df: pd.DataFrame) -> pd.DataFrame:
     # Combine title and selftext for analysis
     df["text_combined"] = df["title"].fillna("") + " " + df["selftext"].fillna("")
 
-    # Analyze sentiment
+    # Score in one pass: TextBlob per text, then assign whole float32
+    # columns and bucket the labels with a single np.digitize pass
+    # (np.select would allocate a boolean mask per label)
     print("Analyzing sentiment...")
-    sentiments = df["text_combined"].apply(analyze_sentiment)
-
-    df["sentiment_polarity"] = sentiments.apply(lambda x: x["polarity"])
-    df["sentiment_subjectivity"] = sentiments.apply(lambda x: x["subjectivity"])
-    df["sentiment_label"] = sentiments.apply(lambda x: x["label"])
+    pols, subs = zip(*[
+        (0.0, 0.0) if (not text or pd.isna(text)) else _score_text(str(text))
+        for text in df["text_combined"].tolist()
+    ]) if len(df) else ((), ())
+    polarity = np.asarray(pols, dtype=np.float32)
+    df["sentiment_polarity"] = polarity
+    df["sentiment_subjectivity"] = np.asarray(subs, dtype=np.float32)
+    codes = np.digitize(polarity, _SENTIMENT_BINS)
+    df["sentiment_label"] = pd.Categorical.from_codes(codes, categories=_SENTIMENT_LABELS)
 
     # Clean up
     df.drop(columns=["text_combined"], inplace=True)
@@ -54,37 +82,110 @@ def add_sentiment_to_df(df: pd.DataFrame) -> pd.DataFrame:
     return df
 
 
+def add_sentiment_cached(df: pd.DataFrame, cache_path: Path = SENTIMENT_CACHE_PATH) -> pd.DataFrame:
+    """Add sentiment columns, reusing cached scores keyed by post id.
+
+    Only posts not seen in a previous run are scored; the cache is
+    persisted as Parquet so repeated runs pay O(new posts), not O(all).
+    """
+    if cache_path.exists():
+        cache = pd.read_parquet(cache_path)
+    else:
+        cache = pd.DataFrame(columns=["id"] + SENTIMENT_COLUMNS)
+
+    merged = df.merge(cache, on="id", how="left")
+    merged.index = df.index
+    missing = merged["sentiment_polarity"].isna().to_numpy()
+
+    if missing.any():
+        print(f"Scoring {missing.sum()} new posts ({len(df) - missing.sum()} cached)...")
+        scored = add_sentiment_to_df(df.loc[missing])
+        for col in SENTIMENT_COLUMNS:
+            merged.loc[missing, col] = scored[col].to_numpy()
+
+        updated = pd.concat(
+            [cache, scored[["id"] + SENTIMENT_COLUMNS]], ignore_index=True
+        ).drop_duplicates("id", keep="last")
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        updated.to_parquet(cache_path, engine="pyarrow", compression="zstd")
+
+    # Pin dtypes: filling through .loc can leave object columns when the
+    # cache started out empty, which breaks numeric plotting downstream
+    merged["sentiment_polarity"] = merged["sentiment_polarity"].astype("float32")
+    merged["sentiment_subjectivity"] = merged["sentiment_subjectivity"].astype("float32")
+    merged["sentiment_label"] = merged["sentiment_label"].astype("category")
+
+    return merged
+
+
+def ensure_sentiment(df: pd.DataFrame, cache_path: Path = SENTIMENT_CACHE_PATH) -> pd.DataFrame:
+    """Return a sentiment-scored frame, scoring (via the cache) at most once.
+
+    Pipeline drivers call this one time up front; downstream stages can
+    then assume the sentiment columns exist instead of each re-checking
+    and potentially re-running the most expensive step in the pipeline.
+    """
+    if "sentiment_label" in df.columns:
+        return df
+    return add_sentiment_cached(df, cache_path=cache_path)
+
+
 def get_sentiment_summary(df: pd.DataFrame) -> dict:
     """Get sentiment summary statistics."""
     if "sentiment_label" not in df.columns:
         df = add_sentiment_to_df(df)
 
+    # Everything below is bincounts over the integer label/subreddit
+    # codes plus one weighted bincount for polarity - a single pass over
+    # the columns with no groupby dispatch
     total = len(df)
-    label_counts = df["sentiment_label"].value_counts()
+    labels = pd.Categorical(df["sentiment_label"])
+    label_names = list(labels.categories)
+    col = {name: j for j, name in enumerate(label_names)}
+    label_counts = np.bincount(labels.codes, minlength=len(label_names))
+    polarity = df["sentiment_polarity"].to_numpy(dtype=np.float64)
+
+    def count(name: str) -> int:
+        return int(label_counts[col[name]]) if name in col else 0
 
     summary = {
         "total_posts": total,
-        "positive": label_counts.get("positive", 0),
-        "negative": label_counts.get("negative", 0),
-        "neutral": label_counts.get("neutral", 0),
-        "positive_pct": label_counts.get("positive", 0) / total * 100,
-        "negative_pct": label_counts.get("negative", 0) / total * 100,
-        "neutral_pct": label_counts.get("neutral", 0) / total * 100,
-        "avg_polarity": df["sentiment_polarity"].mean(),
-        "avg_subjectivity": df["sentiment_subjectivity"].mean(),
+        "positive": count("positive"),
+        "negative": count("negative"),
+        "neutral": count("neutral"),
+        "positive_pct": count("positive") / total * 100,
+        "negative_pct": count("negative") / total * 100,
+        "neutral_pct": count("neutral") / total * 100,
+        "avg_polarity": polarity.mean(),
+        "avg_subjectivity": df["sentiment_subjectivity"].to_numpy(dtype=np.float64).mean(),
     }
 
-    # By subreddit
-    summary["by_subreddit"] = {}
-    for sub in df["subreddit"].unique():
-        sub_df = df[df["subreddit"] == sub]
-        sub_counts = sub_df["sentiment_label"].value_counts()
-        summary["by_subreddit"][sub] = {
-            "positive_pct": sub_counts.get("positive", 0) / len(sub_df) * 100,
-            "negative_pct": sub_counts.get("negative", 0) / len(sub_df) * 100,
-            "neutral_pct": sub_counts.get("neutral", 0) / len(sub_df) * 100,
-            "avg_polarity": sub_df["sentiment_polarity"].mean(),
+    # By subreddit: joint sub x label counts from one bincount over the
+    # combined codes, polarity sums from a weighted bincount
+    subs = pd.Categorical(df["subreddit"])
+    n_labels = len(label_names)
+    n_subs = len(subs.categories)
+    joint = np.bincount(
+        subs.codes.astype(np.int64) * n_labels + labels.codes,
+        minlength=n_subs * n_labels,
+    ).reshape(n_subs, n_labels)
+    sub_totals = joint.sum(axis=1)
+    pol_sums = np.bincount(subs.codes, weights=polarity, minlength=n_subs)
+    pct = joint * (100.0 / np.maximum(sub_totals, 1)[:, None])
+
+    def pct_of(i: int, name: str) -> float:
+        return float(pct[i, col[name]]) if name in col else 0.0
+
+    summary["by_subreddit"] = {
+        sub: {
+            "positive_pct": pct_of(i, "positive"),
+            "negative_pct": pct_of(i, "negative"),
+            "neutral_pct": pct_of(i, "neutral"),
+            "avg_polarity": float(pol_sums[i] / sub_totals[i]),
         }
+        for i, sub in enumerate(subs.categories)
+        if sub_totals[i]
+    }
 
     return summary
 
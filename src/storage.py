@@ -4,31 +4,156 @@ import json
 from pathlib import Path
 from datetime import datetime
 
+import orjson
+
 import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+
+class ParquetBatchWriter:
+    """Incrementally write batches of post dicts to one Parquet file.
+
+    Keeps memory bounded: each batch is converted to an Arrow
+    RecordBatch and flushed, with no full-corpus DataFrame in between.
+    """
+
+    def __init__(self, filepath: Path):
+        self.filepath = filepath
+        self._writer = None
+        self.rows_written = 0
+
+    def write_batch(self, posts: list) -> None:
+        if not posts:
+            return
+        # The scraper yields tuple-backed PostRecords; Arrow wants mappings
+        if hasattr(posts[0], "_asdict"):
+            posts = [p._asdict() for p in posts]
+        batch = pa.RecordBatch.from_pylist(posts)
+        if self._writer is None:
+            schema = batch.schema
+            # All-null columns (e.g. flair) infer as null type; store as string
+            for i, field in enumerate(schema):
+                if pa.types.is_null(field.type):
+                    schema = schema.set(i, pa.field(field.name, pa.string()))
+            self._writer = pq.ParquetWriter(self.filepath, schema, compression="zstd")
+        if batch.schema != self._writer.schema:
+            batch = batch.cast(self._writer.schema)
+        self._writer.write_batch(batch)
+        self.rows_written += len(posts)
+
+    def close(self) -> None:
+        if self._writer is not None:
+            self._writer.close()
+            print(f"Saved {self.rows_written} posts to {self.filepath}")
 
 
-def save_posts_csv(posts: list[dict], filepath: Path) -> None:
-    """Save posts to CSV file."""
+def save_posts_csv(posts: list, filepath: Path) -> None:
+    """Save posts (dicts or tuple-backed PostRecords) to CSV file.
+
+    pd.DataFrame takes NamedTuples directly, deriving columns from the
+    record fields, so no _asdict pass is needed here.
+    """
     df = pd.DataFrame(posts)
     df.to_csv(filepath, index=False)
     print(f"Saved {len(posts)} posts to {filepath}")
 
 
-def save_posts_json(posts: list[dict], filepath: Path) -> None:
-    """Save posts to JSON file."""
-    # Convert datetime objects to strings
-    for post in posts:
-        if isinstance(post.get("created_utc"), datetime):
-            post["created_utc"] = post["created_utc"].isoformat()
+def _json_default(obj):
+    """Fallback for types orjson has no native encoding for.
+
+    pd.Timestamp (from df.to_dict("records")) keeps the ISO form the
+    old json.dump pre-pass produced; anything else falls back to str.
+    """
+    if hasattr(obj, "isoformat"):
+        return obj.isoformat()
+    return str(obj)
+
 
-    with open(filepath, "w", encoding="utf-8") as f:
-        json.dump(posts, f, indent=2, ensure_ascii=False)
+def save_posts_json(posts: list, filepath: Path) -> None:
+    """Save posts (dicts or tuple-backed PostRecords) to JSON file.
+
+    orjson serializes plain datetimes natively; Timestamps and other
+    stragglers go through _json_default.
+    """
+    if posts and hasattr(posts[0], "_asdict"):
+        posts = [p._asdict() for p in posts]
+    with open(filepath, "wb") as f:
+        f.write(orjson.dumps(
+            posts,
+            default=_json_default,
+            option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NAIVE_UTC,
+        ))
     print(f"Saved {len(posts)} posts to {filepath}")
 
 
-def load_posts_csv(filepath: Path) -> pd.DataFrame:
-    """Load posts from CSV file."""
-    return pd.read_csv(filepath, parse_dates=["created_utc"])
+def save_posts_parquet(posts: list, filepath: Path) -> None:
+    """Save posts (dicts or tuple-backed PostRecords) to Parquet file.
+
+    Columnar, typed datetimes, compressed; as with CSV, pd.DataFrame
+    handles NamedTuples without conversion.
+    """
+    df = pd.DataFrame(posts)
+    df.to_parquet(filepath, engine="pyarrow", compression="zstd")
+    print(f"Saved {len(posts)} posts to {filepath}")
+
+
+def load_posts_parquet(filepath: Path, columns: list[str] | None = None) -> pd.DataFrame:
+    """Load posts from Parquet file. Dtypes (incl. datetimes) are preserved."""
+    return pd.read_parquet(filepath, columns=columns)
+
+
+def _optimize_dtypes(df: pd.DataFrame) -> pd.DataFrame:
+    """Shrink a loaded posts frame in place.
+
+    Low-cardinality labels become categories so every downstream
+    groupby/value_counts hashes int codes, and the numeric columns are
+    downcast to the narrowest type that holds Reddit's value ranges.
+    """
+    for col in ("subreddit", "flair", "sentiment_label"):
+        if col in df.columns:
+            df[col] = df[col].astype("category")
+    for col in ("score", "num_comments"):
+        if col in df.columns:
+            df[col] = pd.to_numeric(df[col], downcast="integer")
+    if "upvote_ratio" in df.columns:
+        df["upvote_ratio"] = df["upvote_ratio"].astype("float32")
+    return df
+
+
+def load_posts(filepath: Path, columns: list[str] | None = None) -> pd.DataFrame:
+    """Load posts from Parquet or CSV based on file extension.
+
+    Pass `columns` to project only the fields a pipeline actually uses.
+    """
+    filepath = Path(filepath)
+    if filepath.suffix == ".parquet":
+        return _optimize_dtypes(load_posts_parquet(filepath, columns=columns))
+    return _optimize_dtypes(load_posts_csv(filepath, columns=columns))
+
+
+def load_posts_csv(filepath: Path, columns: list[str] | None = None) -> pd.DataFrame:
+    """Load posts from CSV file.
+
+    Parsed with the multithreaded pyarrow engine; text columns use the
+    Arrow-backed string dtype so .str/regex ops run on contiguous Arrow
+    buffers instead of Python object arrays. created_utc converts based
+    on what the file holds: epoch seconds and ISO strings both take one
+    vectorized to_datetime call instead of per-row parsing.
+    """
+    df = pd.read_csv(
+        filepath,
+        engine="pyarrow",
+        usecols=columns,
+        dtype={"title": "string[pyarrow]", "selftext": "string[pyarrow]"},
+    )
+    if "created_utc" in df.columns:
+        col = df["created_utc"]
+        if pd.api.types.is_numeric_dtype(col):
+            df["created_utc"] = pd.to_datetime(col, unit="s")
+        elif not pd.api.types.is_datetime64_any_dtype(col):
+            df["created_utc"] = pd.to_datetime(col, format="ISO8601", cache=True)
+    return df
 
 
 def load_posts_json(filepath: Path) -> list[dict]:
@@ -1,25 +1,63 @@
 """Visualization utilities for layoff data."""
 
+import os
+import sys
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
 from pathlib import Path
 from datetime import datetime
 
+import numpy as np
 import pandas as pd
+import matplotlib
+if os.environ.get("MPLBACKEND") is None and not sys.stdout.isatty():
+    matplotlib.use("Agg")  # headless batch run: skip GUI backends
 import matplotlib.pyplot as plt
 import seaborn as sns
 
-from src.sentiment import add_sentiment_to_df
-
 # Set style
 sns.set_theme(style="darkgrid")
 plt.rcParams["figure.figsize"] = (12, 6)
-
-
-def plot_posts_over_time(df: pd.DataFrame, output_dir: Path = None) -> None:
+# Cheaper Agg line rendering: full path simplification and chunked
+# path flushing for the long daily/weekly series
+plt.rcParams["path.simplify_threshold"] = 1.0
+plt.rcParams["agg.path.chunksize"] = 10_000
+
+
+def prepare_time_aggregates(df: pd.DataFrame) -> dict:
+    """Timestamp-derived aggregates shared by the time-series plots.
+
+    created_utc is parsed exactly once; the daily and weekly per-sub
+    counts come from one groupby each and are reused by the standalone
+    plots and the dashboard instead of being rebuilt per call.
+    """
+    ts = pd.to_datetime(df["created_utc"])
+    # Day keys as a vectorized datetime64[D] cast - crosstab then counts
+    # over int codes rather than hashing per-row date objects
+    dates = pd.Series(ts.to_numpy().astype("datetime64[D]"), name="date")
+    weeks = ts.dt.to_period("W").dt.start_time
+    sub = df["subreddit"]
+    return {
+        "dates": dates,
+        "weeks": weeks,
+        "daily_by_sub": pd.crosstab(dates, sub.reset_index(drop=True)),
+        "weekly_by_sub": (
+            pd.DataFrame({"week": weeks, "subreddit": sub})
+            .groupby(["week", "subreddit"], observed=True).size().unstack(fill_value=0)
+        ),
+    }
+
+
+def plot_posts_over_time(df: pd.DataFrame, output_dir: Path = None, prepared: dict = None) -> None:
     """Plot number of posts per day."""
+    if prepared is None:
+        prepared = prepare_time_aggregates(df)
     fig, ax = plt.subplots(figsize=(14, 5))
 
-    df["date"] = pd.to_datetime(df["created_utc"]).dt.date
-    daily = df.groupby(["date", "subreddit"]).size().unstack(fill_value=0)
+    # YYYY-MM-DD tick labels rather than full-timestamp strings
+    daily = prepared["daily_by_sub"]
+    daily = daily.set_axis(pd.DatetimeIndex(daily.index).strftime("%Y-%m-%d"))
 
     daily.plot(kind="bar", stacked=True, ax=ax, width=0.8, color=["#FF4500", "#1E90FF"])
 
@@ -33,22 +71,26 @@ def plot_posts_over_time(df: pd.DataFrame, output_dir: Path = None) -> None:
     plt.tight_layout()
 
     if output_dir:
-        plt.savefig(output_dir / "posts_over_time.png", dpi=150)
+        fig.savefig(output_dir / "posts_over_time.png", dpi=150)
         print(f"Saved: posts_over_time.png")
-    plt.show()
+        plt.close(fig)
+    else:
+        plt.show()
 
 
-def plot_company_mentions(stats: dict, output_dir: Path = None) -> None:
+def plot_company_mentions(stats: dict, output_dir: Path = None, n: int = 15, ax=None) -> None:
     """Plot top company mentions as horizontal bar chart."""
-    fig, ax = plt.subplots(figsize=(10, 6))
+    own_fig = ax is None
+    if own_fig:
+        fig, ax = plt.subplots(figsize=(10, 6))
 
     companies = stats.get("company_mentions", {})
     if not companies:
         print("No company mentions to plot")
         return
 
-    # Top 15 companies
-    top = dict(sorted(companies.items(), key=lambda x: x[1], reverse=True)[:15])
+    # Top n companies - heap-based partial sort, no full O(n log n) sort
+    top = dict(Counter(companies).most_common(n))
 
     colors = sns.color_palette("Oranges_r", len(top))
     bars = ax.barh(list(top.keys())[::-1], list(top.values())[::-1], color=colors)
@@ -61,34 +103,53 @@ def plot_company_mentions(stats: dict, output_dir: Path = None) -> None:
         ax.text(bar.get_width() + 0.5, bar.get_y() + bar.get_height()/2,
                 str(count), va="center", fontsize=10)
 
+    if not own_fig:
+        return
     plt.tight_layout()
 
     if output_dir:
-        plt.savefig(output_dir / "company_mentions.png", dpi=150)
+        fig.savefig(output_dir / "company_mentions.png", dpi=150)
         print(f"Saved: company_mentions.png")
-    plt.show()
+        plt.close(fig)
+    else:
+        plt.show()
+
+
+def _draw_score_histogram(ax, df: pd.DataFrame) -> None:
+    """Per-subreddit score histogram (capped at 500) onto one axis.
+
+    Shared edges computed once, then one np.histogram pass per
+    subreddit feeding precounted bars (ax.hist would redo binning and
+    edge handling per call).
+    """
+    edges = np.linspace(0, 500, 51)
+    for sub, subset in df.groupby("subreddit", observed=True, sort=False)["score"]:
+        counts, _ = np.histogram(np.minimum(subset.to_numpy(), 500), bins=edges)
+        ax.bar(edges[:-1], counts, width=edges[1] - edges[0], align="edge",
+               alpha=0.6, label=f"r/{sub}")
+    ax.set_xlabel("Score")
+    ax.set_ylabel("Count")
+    ax.legend()
 
 
-def plot_score_distribution(df: pd.DataFrame, output_dir: Path = None) -> None:
-    """Plot distribution of post scores."""
-    fig, axes = plt.subplots(1, 2, figsize=(14, 5))
+def plot_score_distribution(df: pd.DataFrame, output_dir: Path = None, ax=None) -> None:
+    """Plot distribution of post scores.
 
-    # Histogram
-    for sub in df["subreddit"].unique():
-        subset = df[df["subreddit"] == sub]["score"]
-        # Cap at 500 for better visualization
-        subset_capped = subset.clip(upper=500)
-        axes[0].hist(subset_capped, bins=50, alpha=0.6, label=f"r/{sub}")
+    With ax= only the histogram panel is drawn (dashboard use).
+    """
+    if ax is not None:
+        _draw_score_histogram(ax, df)
+        ax.set_title("Score Distribution", fontweight="bold")
+        return
+
+    fig, axes = plt.subplots(1, 2, figsize=(14, 5))
 
+    _draw_score_histogram(axes[0], df)
     axes[0].set_title("Score Distribution (capped at 500)", fontsize=12, fontweight="bold")
-    axes[0].set_xlabel("Score")
-    axes[0].set_ylabel("Count")
-    axes[0].legend()
 
-    # Box plot by subreddit
-    df_plot = df.copy()
-    df_plot["score_capped"] = df_plot["score"].clip(upper=500)
-    sns.boxplot(data=df_plot, x="subreddit", y="score_capped", ax=axes[1], palette="Set2")
+    # Box plot by subreddit - scratch capped array, no frame copy
+    score_capped = np.minimum(df["score"].to_numpy(), 500)
+    sns.boxplot(x=df["subreddit"], y=score_capped, ax=axes[1], palette="Set2")
     axes[1].set_title("Score by Subreddit", fontsize=12, fontweight="bold")
     axes[1].set_xlabel("Subreddit")
     axes[1].set_ylabel("Score")
@@ -96,22 +157,30 @@ def plot_score_distribution(df: pd.DataFrame, output_dir: Path = None) -> None:
     plt.tight_layout()
 
     if output_dir:
-        plt.savefig(output_dir / "score_distribution.png", dpi=150)
+        fig.savefig(output_dir / "score_distribution.png", dpi=150)
         print(f"Saved: score_distribution.png")
-    plt.show()
+        plt.close(fig)
+    else:
+        plt.show()
 
 
-def plot_engagement_scatter(df: pd.DataFrame, output_dir: Path = None) -> None:
+def plot_engagement_scatter(df: pd.DataFrame, output_dir: Path = None, ax=None) -> None:
     """Scatter plot of score vs comments."""
-    fig, ax = plt.subplots(figsize=(10, 6))
+    # Beyond ~20k markers the extra points cost rasterization time but
+    # add no visible density; a fixed-seed sample keeps output stable
+    if len(df) > 20_000:
+        df = df.sample(20_000, random_state=0)
+
+    own_fig = ax is None
+    if own_fig:
+        fig, ax = plt.subplots(figsize=(10, 6))
 
     colors = {"layoffs": "#FF4500", "jobs": "#1E90FF"}
 
-    for sub in df["subreddit"].unique():
-        subset = df[df["subreddit"] == sub]
+    for sub, subset in df.groupby("subreddit", observed=True, sort=False):
         ax.scatter(
-            subset["score"].clip(upper=2000),
-            subset["num_comments"].clip(upper=300),
+            np.minimum(subset["score"].to_numpy(), 2000),
+            np.minimum(subset["num_comments"].to_numpy(), 300),
             alpha=0.5,
             label=f"r/{sub}",
             c=colors.get(sub, "gray"),
@@ -123,20 +192,27 @@ def plot_engagement_scatter(df: pd.DataFrame, output_dir: Path = None) -> None:
     ax.set_ylabel("Number of Comments (capped at 300)")
     ax.legend()
 
+    if not own_fig:
+        return
     plt.tight_layout()
 
     if output_dir:
-        plt.savefig(output_dir / "engagement_scatter.png", dpi=150)
+        fig.savefig(output_dir / "engagement_scatter.png", dpi=150)
         print(f"Saved: engagement_scatter.png")
-    plt.show()
+        plt.close(fig)
+    else:
+        plt.show()
 
 
-def plot_weekly_trend(df: pd.DataFrame, output_dir: Path = None) -> None:
+def plot_weekly_trend(df: pd.DataFrame, output_dir: Path = None, prepared: dict = None, ax=None) -> None:
     """Plot weekly post volume trend."""
-    fig, ax = plt.subplots(figsize=(12, 5))
+    if prepared is None:
+        prepared = prepare_time_aggregates(df)
+    own_fig = ax is None
+    if own_fig:
+        fig, ax = plt.subplots(figsize=(12, 5))
 
-    df["week"] = pd.to_datetime(df["created_utc"]).dt.to_period("W").dt.start_time
-    weekly = df.groupby(["week", "subreddit"]).size().unstack(fill_value=0)
+    weekly = prepared["weekly_by_sub"]
 
     weekly.plot(kind="line", marker="o", ax=ax, linewidth=2, markersize=6)
 
@@ -144,29 +220,43 @@ def plot_weekly_trend(df: pd.DataFrame, output_dir: Path = None) -> None:
     ax.set_xlabel("Week")
     ax.set_ylabel("Number of Posts")
     ax.legend(title="Subreddit", labels=[f"r/{c}" for c in weekly.columns])
+    plt.setp(ax.xaxis.get_majorticklabels(), rotation=45, ha="right")
 
-    plt.xticks(rotation=45, ha="right")
+    if not own_fig:
+        return
     plt.tight_layout()
 
     if output_dir:
-        plt.savefig(output_dir / "weekly_trend.png", dpi=150)
+        fig.savefig(output_dir / "weekly_trend.png", dpi=150)
         print(f"Saved: weekly_trend.png")
-    plt.show()
+        plt.close(fig)
+    else:
+        plt.show()
 
 
 def plot_top_posts(df: pd.DataFrame, n: int = 10, output_dir: Path = None) -> None:
     """Plot top posts by score."""
     fig, ax = plt.subplots(figsize=(12, 6))
 
-    top = df.nlargest(n, "score")[["title", "score", "subreddit"]].copy()
-    top["title_short"] = top["title"].str[:50] + "..."
-    top = top.iloc[::-1]  # Reverse for horizontal bar
+    # Partial-sort the score buffer for the top n row positions - no
+    # sorted three-column copy of the frame - then slice just those n
+    # titles with Arrow's C string kernel. Reversed for horizontal bars.
+    scores = df["score"].to_numpy()
+    n = min(n, len(scores))
+    if n == 0:
+        print("No posts to plot")
+        return
+    idx = np.argpartition(-scores, n - 1)[:n]
+    idx = idx[np.argsort(scores[idx])]
+
+    titles = df["title"].astype("string[pyarrow]").iloc[idx].str.slice(0, 50) + "..."
+    subreddits = df["subreddit"].iloc[idx]
 
-    colors = ["#FF4500" if s == "layoffs" else "#1E90FF" for s in top["subreddit"]]
-    bars = ax.barh(range(len(top)), top["score"], color=colors)
+    colors = ["#FF4500" if s == "layoffs" else "#1E90FF" for s in subreddits]
+    bars = ax.barh(range(n), scores[idx], color=colors)
 
-    ax.set_yticks(range(len(top)))
-    ax.set_yticklabels(top["title_short"])
+    ax.set_yticks(range(n))
+    ax.set_yticklabels(titles)
     ax.set_title(f"Top {n} Posts by Score", fontsize=14, fontweight="bold")
     ax.set_xlabel("Score")
 
@@ -181,73 +271,89 @@ def plot_top_posts(df: pd.DataFrame, n: int = 10, output_dir: Path = None) -> No
     plt.tight_layout()
 
     if output_dir:
-        plt.savefig(output_dir / "top_posts.png", dpi=150)
+        fig.savefig(output_dir / "top_posts.png", dpi=150)
         print(f"Saved: top_posts.png")
-    plt.show()
+        plt.close(fig)
+    else:
+        plt.show()
 
 
-def create_dashboard(df: pd.DataFrame, stats: dict, output_dir: Path = None) -> None:
+def create_dashboard(df: pd.DataFrame, stats: dict, output_dir: Path = None, prepared: dict = None) -> None:
     """Create a multi-panel dashboard."""
+    if prepared is None:
+        prepared = prepare_time_aggregates(df)
     fig = plt.figure(figsize=(16, 12))
 
-    # 1. Weekly trend (top left)
-    ax1 = fig.add_subplot(2, 2, 1)
-    df["week"] = pd.to_datetime(df["created_utc"]).dt.to_period("W").dt.start_time
-    weekly = df.groupby(["week", "subreddit"]).size().unstack(fill_value=0)
-    weekly.plot(kind="line", marker="o", ax=ax1, linewidth=2)
-    ax1.set_title("Weekly Post Trend", fontweight="bold")
-    ax1.set_xlabel("Week")
-    ax1.set_ylabel("Posts")
-    ax1.legend([f"r/{c}" for c in weekly.columns])
-    plt.setp(ax1.xaxis.get_majorticklabels(), rotation=45, ha="right")
-
-    # 2. Company mentions (top right)
-    ax2 = fig.add_subplot(2, 2, 2)
-    companies = stats.get("company_mentions", {})
-    top = dict(sorted(companies.items(), key=lambda x: x[1], reverse=True)[:10])
-    if top:
-        ax2.barh(list(top.keys())[::-1], list(top.values())[::-1], color=sns.color_palette("Oranges_r", len(top)))
-        ax2.set_title("Top Company Mentions", fontweight="bold")
-        ax2.set_xlabel("Mentions")
-
-    # 3. Score distribution (bottom left)
-    ax3 = fig.add_subplot(2, 2, 3)
-    for sub in df["subreddit"].unique():
-        subset = df[df["subreddit"] == sub]["score"].clip(upper=500)
-        ax3.hist(subset, bins=40, alpha=0.6, label=f"r/{sub}")
-    ax3.set_title("Score Distribution", fontweight="bold")
-    ax3.set_xlabel("Score")
-    ax3.set_ylabel("Count")
-    ax3.legend()
-
-    # 4. Engagement scatter (bottom right)
-    ax4 = fig.add_subplot(2, 2, 4)
-    colors = {"layoffs": "#FF4500", "jobs": "#1E90FF"}
-    for sub in df["subreddit"].unique():
-        subset = df[df["subreddit"] == sub]
-        ax4.scatter(
-            subset["score"].clip(upper=1500),
-            subset["num_comments"].clip(upper=200),
-            alpha=0.5, label=f"r/{sub}", c=colors.get(sub, "gray"), s=20
-        )
-    ax4.set_title("Score vs Comments", fontweight="bold")
-    ax4.set_xlabel("Score")
-    ax4.set_ylabel("Comments")
-    ax4.legend()
+    # Panels delegate to the standalone helpers via ax=, so each data
+    # derivation (weekly counts, mention tallies, histogram bins) lives
+    # in exactly one place and runs once per dashboard
+    plot_weekly_trend(df, prepared=prepared, ax=fig.add_subplot(2, 2, 1))
+    plot_company_mentions(stats, n=10, ax=fig.add_subplot(2, 2, 2))
+    plot_score_distribution(df, ax=fig.add_subplot(2, 2, 3))
+    plot_engagement_scatter(df, ax=fig.add_subplot(2, 2, 4))
 
     plt.suptitle("Reddit Layoffs Dashboard", fontsize=16, fontweight="bold", y=1.02)
     plt.tight_layout()
 
     if output_dir:
-        plt.savefig(output_dir / "dashboard.png", dpi=150, bbox_inches="tight")
+        fig.savefig(output_dir / "dashboard.png", dpi=150, bbox_inches="tight")
         print(f"Saved: dashboard.png")
-    plt.show()
+        plt.close(fig)
+    else:
+        plt.show()
+
+
+def _sentiment_by_sub_pct(df: pd.DataFrame) -> pd.DataFrame:
+    """Percent sentiment mix per subreddit.
+
+    Reindexing keeps all three label columns even when one label has no
+    posts at all. Shared by the standalone distribution plot and the
+    sentiment dashboard.
+    """
+    counts = (
+        df.groupby(["subreddit", "sentiment_label"], observed=True).size().unstack(fill_value=0)
+        .reindex(columns=["positive", "neutral", "negative"], fill_value=0)
+    )
+    # Row-normalize on the raw 2D array - one broadcast division instead
+    # of DataFrame.div's label alignment and intermediate frames
+    arr = counts.to_numpy(dtype=np.float64)
+    pct = arr * (100.0 / arr.sum(axis=1, keepdims=True))
+    return pd.DataFrame(pct, index=counts.index, columns=counts.columns)
+
+
+def _draw_daily_polarity(ax, df: pd.DataFrame) -> None:
+    """Daily mean polarity line with positive/negative shading on one axis."""
+    dates = pd.to_datetime(df["created_utc"]).dt.date.rename("date")
+    daily_polarity = df.groupby(dates)["sentiment_polarity"].mean()
+
+    ax.plot(daily_polarity.index, daily_polarity.values, marker="o", linewidth=2, color="#3498db")
+    ax.axhline(y=0, color="gray", linestyle="--", alpha=0.5)
+    ax.fill_between(
+        daily_polarity.index,
+        daily_polarity.values,
+        0,
+        where=(daily_polarity.values > 0),
+        alpha=0.3,
+        color="#2ecc71",
+        label="Positive",
+    )
+    ax.fill_between(
+        daily_polarity.index,
+        daily_polarity.values,
+        0,
+        where=(daily_polarity.values < 0),
+        alpha=0.3,
+        color="#e74c3c",
+        label="Negative",
+    )
+    plt.setp(ax.xaxis.get_majorticklabels(), rotation=45, ha="right")
 
 
 def plot_sentiment_distribution(df: pd.DataFrame, output_dir: Path = None) -> None:
     """Plot sentiment distribution pie chart and bar chart."""
-    if "sentiment_label" not in df.columns:
-        df = add_sentiment_to_df(df)
+    from src.sentiment import ensure_sentiment
+
+    df = ensure_sentiment(df)
 
     fig, axes = plt.subplots(1, 2, figsize=(14, 5))
 
@@ -266,8 +372,7 @@ def plot_sentiment_distribution(df: pd.DataFrame, output_dir: Path = None) -> No
     axes[0].set_title("Overall Sentiment Distribution", fontsize=12, fontweight="bold")
 
     # Bar chart - by subreddit
-    sentiment_by_sub = df.groupby(["subreddit", "sentiment_label"]).size().unstack(fill_value=0)
-    sentiment_by_sub_pct = sentiment_by_sub.div(sentiment_by_sub.sum(axis=1), axis=0) * 100
+    sentiment_by_sub_pct = _sentiment_by_sub_pct(df)
 
     sentiment_by_sub_pct[["positive", "neutral", "negative"]].plot(
         kind="bar",
@@ -284,53 +389,34 @@ def plot_sentiment_distribution(df: pd.DataFrame, output_dir: Path = None) -> No
     plt.tight_layout()
 
     if output_dir:
-        plt.savefig(output_dir / "sentiment_distribution.png", dpi=150)
+        fig.savefig(output_dir / "sentiment_distribution.png", dpi=150)
         print(f"Saved: sentiment_distribution.png")
-    plt.show()
+        plt.close(fig)
+    else:
+        plt.show()
 
     return df
 
 
 def plot_sentiment_over_time(df: pd.DataFrame, output_dir: Path = None) -> None:
     """Plot sentiment trend over time."""
-    if "sentiment_label" not in df.columns:
-        df = add_sentiment_to_df(df)
-
-    fig, axes = plt.subplots(2, 1, figsize=(14, 8))
+    from src.sentiment import ensure_sentiment
 
-    df["date"] = pd.to_datetime(df["created_utc"]).dt.date
+    df = ensure_sentiment(df)
 
-    # Daily average polarity
-    daily_polarity = df.groupby("date")["sentiment_polarity"].mean()
+    fig, axes = plt.subplots(2, 1, figsize=(14, 8))
 
-    axes[0].plot(daily_polarity.index, daily_polarity.values, marker="o", linewidth=2, color="#3498db")
-    axes[0].axhline(y=0, color="gray", linestyle="--", alpha=0.5)
-    axes[0].fill_between(
-        daily_polarity.index,
-        daily_polarity.values,
-        0,
-        where=(daily_polarity.values > 0),
-        alpha=0.3,
-        color="#2ecc71",
-        label="Positive",
-    )
-    axes[0].fill_between(
-        daily_polarity.index,
-        daily_polarity.values,
-        0,
-        where=(daily_polarity.values < 0),
-        alpha=0.3,
-        color="#e74c3c",
-        label="Negative",
-    )
+    # Daily average polarity (grouped on a local date key; the caller's
+    # frame is left untouched)
+    _draw_daily_polarity(axes[0], df)
     axes[0].set_title("Daily Average Sentiment Polarity", fontsize=12, fontweight="bold")
     axes[0].set_xlabel("Date")
     axes[0].set_ylabel("Polarity (-1 to +1)")
     axes[0].legend()
-    plt.setp(axes[0].xaxis.get_majorticklabels(), rotation=45, ha="right")
 
     # Daily sentiment counts
-    daily_sentiment = df.groupby(["date", "sentiment_label"]).size().unstack(fill_value=0)
+    dates = pd.to_datetime(df["created_utc"]).dt.date.rename("date")
+    daily_sentiment = df.groupby([dates, "sentiment_label"], observed=True).size().unstack(fill_value=0)
     colors = {"positive": "#2ecc71", "neutral": "#95a5a6", "negative": "#e74c3c"}
 
     for label in ["positive", "neutral", "negative"]:
@@ -353,17 +439,20 @@ def plot_sentiment_over_time(df: pd.DataFrame, output_dir: Path = None) -> None:
     plt.tight_layout()
 
     if output_dir:
-        plt.savefig(output_dir / "sentiment_over_time.png", dpi=150)
+        fig.savefig(output_dir / "sentiment_over_time.png", dpi=150)
         print(f"Saved: sentiment_over_time.png")
-    plt.show()
+        plt.close(fig)
+    else:
+        plt.show()
 
     return df
 
 
 def plot_sentiment_vs_engagement(df: pd.DataFrame, output_dir: Path = None) -> None:
     """Plot relationship between sentiment and engagement."""
-    if "sentiment_label" not in df.columns:
-        df = add_sentiment_to_df(df)
+    from src.sentiment import ensure_sentiment
+
+    df = ensure_sentiment(df)
 
     fig, axes = plt.subplots(1, 2, figsize=(14, 5))
 
@@ -374,7 +463,7 @@ def plot_sentiment_vs_engagement(df: pd.DataFrame, output_dir: Path = None) -> N
         subset = df[df["sentiment_label"] == label]
         axes[0].scatter(
             subset["sentiment_polarity"],
-            subset["score"].clip(upper=1000),
+            np.minimum(subset["score"].to_numpy(), 1000),
             alpha=0.5,
             label=label.capitalize(),
             c=colors[label],
@@ -389,9 +478,8 @@ def plot_sentiment_vs_engagement(df: pd.DataFrame, output_dir: Path = None) -> N
     # Box plot: sentiment label vs score
     order = ["negative", "neutral", "positive"]
     sns.boxplot(
-        data=df,
-        x="sentiment_label",
-        y=df["score"].clip(upper=500),
+        x=df["sentiment_label"],
+        y=np.minimum(df["score"].to_numpy(), 500),
         order=order,
         palette=colors,
         ax=axes[1],
@@ -403,17 +491,20 @@ def plot_sentiment_vs_engagement(df: pd.DataFrame, output_dir: Path = None) -> N
     plt.tight_layout()
 
     if output_dir:
-        plt.savefig(output_dir / "sentiment_vs_engagement.png", dpi=150)
+        fig.savefig(output_dir / "sentiment_vs_engagement.png", dpi=150)
         print(f"Saved: sentiment_vs_engagement.png")
-    plt.show()
+        plt.close(fig)
+    else:
+        plt.show()
 
     return df
 
 
 def create_sentiment_dashboard(df: pd.DataFrame, output_dir: Path = None) -> pd.DataFrame:
     """Create a sentiment-focused dashboard."""
-    if "sentiment_label" not in df.columns:
-        df = add_sentiment_to_df(df)
+    from src.sentiment import ensure_sentiment
+
+    df = ensure_sentiment(df)
 
     fig = plt.figure(figsize=(16, 12))
 
@@ -433,12 +524,10 @@ def create_sentiment_dashboard(df: pd.DataFrame, output_dir: Path = None) -> pd.
 
     # 2. By subreddit (top right)
     ax2 = fig.add_subplot(2, 2, 2)
-    sentiment_by_sub = df.groupby(["subreddit", "sentiment_label"]).size().unstack(fill_value=0)
-    sentiment_by_sub_pct = sentiment_by_sub.div(sentiment_by_sub.sum(axis=1), axis=0) * 100
-    if all(c in sentiment_by_sub_pct.columns for c in ["positive", "neutral", "negative"]):
-        sentiment_by_sub_pct[["positive", "neutral", "negative"]].plot(
-            kind="bar", ax=ax2, color=[colors["positive"], colors["neutral"], colors["negative"]], width=0.7
-        )
+    sentiment_by_sub_pct = _sentiment_by_sub_pct(df)
+    sentiment_by_sub_pct[["positive", "neutral", "negative"]].plot(
+        kind="bar", ax=ax2, color=[colors["positive"], colors["neutral"], colors["negative"]], width=0.7
+    )
     ax2.set_title("Sentiment by Subreddit", fontweight="bold")
     ax2.set_ylabel("Percentage")
     ax2.set_xticklabels([f"r/{x.get_text()}" for x in ax2.get_xticklabels()], rotation=0)
@@ -446,22 +535,14 @@ def create_sentiment_dashboard(df: pd.DataFrame, output_dir: Path = None) -> pd.
 
     # 3. Polarity over time (bottom left)
     ax3 = fig.add_subplot(2, 2, 3)
-    df["date"] = pd.to_datetime(df["created_utc"]).dt.date
-    daily_polarity = df.groupby("date")["sentiment_polarity"].mean()
-    ax3.plot(daily_polarity.index, daily_polarity.values, marker="o", linewidth=2, color="#3498db")
-    ax3.axhline(y=0, color="gray", linestyle="--", alpha=0.5)
-    ax3.fill_between(daily_polarity.index, daily_polarity.values, 0,
-                     where=(daily_polarity.values > 0), alpha=0.3, color="#2ecc71")
-    ax3.fill_between(daily_polarity.index, daily_polarity.values, 0,
-                     where=(daily_polarity.values < 0), alpha=0.3, color="#e74c3c")
+    _draw_daily_polarity(ax3, df)
     ax3.set_title("Daily Avg Polarity", fontweight="bold")
     ax3.set_ylabel("Polarity")
-    plt.setp(ax3.xaxis.get_majorticklabels(), rotation=45, ha="right")
 
     # 4. Sentiment vs score (bottom right)
     ax4 = fig.add_subplot(2, 2, 4)
     order = ["negative", "neutral", "positive"]
-    sns.boxplot(data=df, x="sentiment_label", y=df["score"].clip(upper=500),
+    sns.boxplot(x=df["sentiment_label"], y=np.minimum(df["score"].to_numpy(), 500),
                 order=order, palette=colors, ax=ax4)
     ax4.set_title("Score by Sentiment", fontweight="bold")
     ax4.set_xlabel("Sentiment")
@@ -471,8 +552,43 @@ def create_sentiment_dashboard(df: pd.DataFrame, output_dir: Path = None) -> pd.
     plt.tight_layout()
 
     if output_dir:
-        plt.savefig(output_dir / "sentiment_dashboard.png", dpi=150, bbox_inches="tight")
+        fig.savefig(output_dir / "sentiment_dashboard.png", dpi=150, bbox_inches="tight")
         print(f"Saved: sentiment_dashboard.png")
-    plt.show()
+        plt.close(fig)
+    else:
+        plt.show()
 
     return df
+
+
+def _render_stage(name: str, df: pd.DataFrame, stats: dict, output_dir: Path, prepared: dict) -> None:
+    """Render one named figure; runs inside a worker process."""
+    if name == "weekly":
+        plot_weekly_trend(df, output_dir, prepared=prepared)
+    elif name == "mentions":
+        plot_company_mentions(stats, output_dir)
+    elif name == "scores":
+        plot_score_distribution(df, output_dir)
+    elif name == "scatter":
+        plot_engagement_scatter(df, output_dir)
+    elif name == "top_posts":
+        plot_top_posts(df, 10, output_dir)
+    elif name == "dashboard":
+        create_dashboard(df, stats, output_dir, prepared=prepared)
+
+
+def render_all(df: pd.DataFrame, stats: dict, output_dir: Path = None, prepared: dict = None) -> None:
+    """Render the six non-sentiment figures across a small process pool.
+
+    The figures are independent and Agg rendering is CPU-bound, so each
+    runs in its own worker; the prepared aggregates and stats are
+    pickled once per worker alongside the posts frame. Sentiment plots
+    stay serial in the driver because they share the scored frame.
+    """
+    if prepared is None:
+        prepared = prepare_time_aggregates(df)
+    worker = partial(_render_stage, df=df, stats=stats, output_dir=output_dir, prepared=prepared)
+    names = ["weekly", "mentions", "scores", "scatter", "top_posts", "dashboard"]
+    with ProcessPoolExecutor(max_workers=4) as executor:
+        # Consume the iterator so worker exceptions surface here
+        list(executor.map(worker, names))
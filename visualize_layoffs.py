@@ -8,6 +8,7 @@ Usage:
 """
 
 import argparse
+from datetime import datetime, timedelta
 from pathlib import Path
 
 import pandas as pd
@@ -15,15 +16,11 @@ import pandas as pd
 from src.layoffs_data import (
     fetch_layoffs_data,
     clean_layoffs_data,
-    get_layoffs_last_n_months,
 )
 from src.layoffs_viz import (
-    plot_monthly_trend,
-    plot_top_companies,
-    plot_industry_breakdown,
-    plot_company_timeline,
-    plot_stacked_area,
+    prepare_plot_data,
     create_layoffs_dashboard,
+    render_all,
 )
 
 
@@ -34,11 +31,12 @@ def main():
     parser.add_argument("--save", action="store_true", help="Save charts")
     args = parser.parse_args()
 
-    # Fetch and prepare data
+    # Fetch and prepare data; the cutoff is pushed into the fetch so
+    # cleaning and the chart aggregates only ever see the window
     print("Loading layoff data...\n")
-    df = fetch_layoffs_data()
+    cutoff = datetime.now() - timedelta(days=args.months * 30)
+    df = fetch_layoffs_data(cutoff=cutoff)
     df = clean_layoffs_data(df)
-    df = get_layoffs_last_n_months(df, args.months)
 
     total = df['laid_off_count'].sum()
     print(f"Total layoffs in last {args.months} months: {total:,}")
@@ -48,24 +46,15 @@ def main():
     # Output directory
     output_dir = Path("data") if args.save else None
 
+    # Month column and shared aggregates computed once for every chart
+    prepared = prepare_plot_data(df)
+
     if args.dashboard:
         print("\nGenerating dashboard...")
-        create_layoffs_dashboard(df, output_dir)
+        create_layoffs_dashboard(df, output_dir, prepared=prepared)
     else:
-        print("\n[1/5] Monthly Trend...")
-        plot_monthly_trend(df, output_dir)
-
-        print("\n[2/5] Top Companies...")
-        plot_top_companies(df, 15, output_dir)
-
-        print("\n[3/5] Industry Breakdown...")
-        plot_industry_breakdown(df, output_dir)
-
-        print("\n[4/5] Company Timeline Heatmap...")
-        plot_company_timeline(df, 10, output_dir)
-
-        print("\n[5/5] Dashboard...")
-        create_layoffs_dashboard(df, output_dir)
+        print("\nRendering 6 charts in parallel...")
+        render_all(df, output_dir, prepared=prepared)
 
     print("\nDone!")
 